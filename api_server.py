@@ -19,6 +19,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from crawl4ai_poc import Crawl4AIPOCTool
 from crawl4ai_enterprise import EnterpriseWebCrawler, CrawlRequest, IntentType
 from crawl4ai_stealth_definitive import Crawl4AIStealthEngine, StealthResult
+from crawl4ai_common import close_pooled_resources
 from api_validation import (
     api_endpoint, validate_url, validate_urls_array, validate_query,
     validate_stealth_level, validate_concurrent, validate_max_urls,
@@ -40,6 +41,7 @@ def run_async(coro):
         asyncio.set_event_loop(loop)
         return loop.run_until_complete(coro)
     finally:
+        loop.run_until_complete(close_pooled_resources(poc, enterprise_crawler, stealth_engine))
         loop.close()
 
 @app.route('/api/health', methods=['GET'])
@@ -192,7 +194,7 @@ def batch_smart_crawl():
     
     # Execute batch crawl
     async def _batch_crawl():
-        return await enterprise_crawler.batch_smart_crawl(requests, max_concurrent)
+        return await enterprise_crawler.batch_smart_crawl_list(requests, max_concurrent)
     
     results = run_async(_batch_crawl())
     
@@ -323,7 +325,8 @@ def crawl():
                 concurrent = int(data.get('concurrent', 2))
                 if not urls:
                     raise ValueError('URLs are required for batch mode')
-                result = await poc.batch_crawl(urls, concurrent)
+                stealth = data.get('stealth', False)
+                result = await poc.batch_crawl(urls, concurrent, use_stealth=stealth)
                 
             elif mode == 'media':
                 download_images = data.get('download_images', True)
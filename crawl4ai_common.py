@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Crawl4AI Shared Helpers
+Small utilities used by the POC tool, the enterprise engine and the stealth engine
+"""
+
+import asyncio
+import json
+import logging
+import re
+import weakref
+from collections import OrderedDict
+from typing import Any, Optional
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_LOGGER = logging.getLogger("crawl4ai_common")
+
+
+def minify_js(source: str) -> str:
+    """Drop // comments and collapse whitespace (scripts here terminate statements with ';')"""
+    source = re.sub(r"(?m)(^|\s)//[^\n]*", r"\1", source)
+    return re.sub(r"\s+", " ", source).strip()
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, via orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+class BoundedDict(OrderedDict):
+    """OrderedDict that evicts its least recently used entries once maxlen is reached"""
+    
+    def __init__(self, maxlen: int = 10_000, *args, **kwargs):
+        self._maxlen = maxlen
+        super().__init__(*args, **kwargs)
+    
+    def get(self, key, default=None):
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            return default
+        return super().get(key, default)
+    
+    def __setitem__(self, key, value):
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        while len(self) > self._maxlen:
+            self.popitem(last=False)
+
+
+class PooledCrawlerMixin:
+    """One long-lived AsyncWebCrawler per event loop, started on first use and closed by aclose()"""
+    
+    # Browser settings for the pooled crawler; None uses crawl4ai's defaults
+    _browser_config: Optional[BrowserConfig] = None
+    
+    def __init__(self):
+        self._crawlers = weakref.WeakKeyDictionary()
+        self._crawler_locks = weakref.WeakKeyDictionary()
+    
+    async def _get_crawler(self) -> AsyncWebCrawler:
+        """Return the long-lived crawler for the running event loop, starting it once"""
+        loop = asyncio.get_running_loop()
+        crawler = self._crawlers.get(loop)
+        if crawler is not None:
+            return crawler
+        
+        # Concurrent first calls (e.g. batch crawls) must not launch several browsers
+        lock = self._crawler_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            crawler = self._crawlers.get(loop)
+            if crawler is None:
+                crawler = AsyncWebCrawler(config=self._browser_config)
+                await crawler.__aenter__()
+                self._crawlers[loop] = crawler
+        return crawler
+    
+    async def aclose(self):
+        """Close the shared crawler for the running event loop"""
+        crawler = self._crawlers.pop(asyncio.get_running_loop(), None)
+        if crawler is not None:
+            await crawler.__aexit__(None, None, None)
+    
+    async def __aenter__(self):
+        await self._get_crawler()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+async def close_pooled_resources(*resources):
+    """Call aclose() on each resource for the current event loop, logging failures instead of raising"""
+    for resource in resources:
+        try:
+            await resource.aclose()
+        except Exception as e:
+            _LOGGER.warning(f"Failed to close {type(resource).__name__}: {e}")
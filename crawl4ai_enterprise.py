@@ -6,14 +6,21 @@ Integrates Crawl4AI 0.7.x enterprise features with intelligent routing
 """
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
 import random
+import re
 import time
-from typing import Dict, Any, List, Optional, Tuple, Union
+import weakref
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
+from operator import itemgetter
+from types import MappingProxyType
+from urllib.parse import urlsplit
 
 try:
     from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, LLMConfig, BrowserConfig
@@ -40,6 +47,68 @@ except ImportError:
     print("❌ crawl4ai not installed. Install with: pip install crawl4ai")
     raise
 
+from crawl4ai_common import BoundedDict
+
+# Feature flags reported by get_performance_metrics (read-only; callers get plain-dict copies)
+_FEATURES_AVAILABLE = MappingProxyType({
+    "enterprise": ENTERPRISE_FEATURES_AVAILABLE,
+    "advanced_stealth": ADVANCED_STEALTH_AVAILABLE
+})
+
+# Eager sparse BM25 for URL discovery (optional)
+try:
+    import bm25s
+    BM25S_AVAILABLE = True
+except ImportError:
+    BM25S_AVAILABLE = False
+
+# JIT-compiled BM25S scoring/top-k (optional)
+try:
+    import numba  # noqa: F401
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+_BM25_BACKEND = "numba" if NUMBA_AVAILABLE else "numpy"
+
+# Enterprise logging, configured once at import
+_LOGGER = logging.getLogger("crawl4ai_enterprise")
+if not _LOGGER.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    _LOGGER.addHandler(_handler)
+    _LOGGER.setLevel(logging.INFO)
+
+# Extraction patterns
+_TABLE_RE = re.compile(r'\|[^\n]*\|(?:\n\|[^\n]*\|)+')
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?%?')
+_PRICE_RE = re.compile(r'\$\d+(?:\.\d{2})?|\d+(?:\.\d{2})?\s*(?:USD|EUR|GBP)')
+
+# URL discovery scoring
+_URL_KEY = itemgetter('url')
+_SEED_SCORE_THRESHOLD = 0.3
+_SEED_INDEX_TTL = 3600  # seconds before a sitemap index is rebuilt
+_SEED_INDEX_MAX_URLS = 1000  # sitemap entries head-fetched into one BM25S index
+_DISCOVERY_CACHE_TTL = 3600  # seconds a discover_urls result is reused
+
+@functools.lru_cache(maxsize=1024)
+def _tokenize_query(query: str) -> List[List[str]]:
+    """Tokenize a discovery query once; repeated queries reuse the tokens"""
+    return bm25s.tokenize([query], stopwords="en", return_ids=False, show_progress=False)
+
+# Content size above which extraction runs in a worker thread
+_EXTRACTION_OFFLOAD_THRESHOLD = 32 * 1024
+
+def _url_host(url: str) -> str:
+    """Lowercased hostname of a URL; scheme-less input like 'example.com/docs' is read as a netloc"""
+    return urlsplit(url if "://" in url else f"//{url}").hostname or ""
+
+def _first_matches(pattern: re.Pattern, content: str, limit: int) -> List[str]:
+    """Return the first `limit` matches without scanning the rest of the content"""
+    return [m.group(0) for m in itertools.islice(pattern.finditer(content), limit)]
+
 # Intent Detection System
 class IntentType(Enum):
     ARTICLE = "article"
@@ -92,36 +161,68 @@ class CrawlResult:
         if self.performance is None:
             self.performance = {}
 
+@dataclass
+class CrawlContext:
+    """Per-request state parsed once and shared across the crawl lifecycle"""
+    url: str
+    host: str
+    intent: Optional[IntentType] = None
+    
+    @classmethod
+    def from_request(cls, request: CrawlRequest) -> "CrawlContext":
+        return cls(
+            url=request.url,
+            host=_url_host(request.url),
+            intent=request.intent
+        )
+
 class EnterpriseWebCrawler:
     """Enterprise-grade web crawler with 0.7.x features"""
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
-        self.logger = self._setup_logging()
-        self.session_cache = {}
-        self.performance_metrics = {}
+        self.logger = _LOGGER
+        self.session_cache = BoundedDict(maxlen=self.config.get("session_cache_size", 10_000))
+        self.performance_metrics = BoundedDict(maxlen=self.config.get("metrics_history_size", 10_000))
+        self._discovery_cache = BoundedDict(maxlen=1024)  # key -> (timestamp, urls)
+        
+        # Pooled URL seeders, one per event loop, opened on first discovery (see _get_seeder)
+        self._seeders = weakref.WeakKeyDictionary()
+        self._seeder_locks = weakref.WeakKeyDictionary()
+        
+        # Running aggregates so metrics don't rescan performance_metrics
+        # (Welford: count, mean and sum of squared deviations of durations)
+        self._perf_total: int = 0
+        self._perf_success: int = 0
+        self._perf_mean: float = 0.0
+        self._perf_m2: float = 0.0
+        self._metrics_dirty = True
+        self._metrics_cache: Optional[Dict[str, Any]] = None
         
-        # Intent detection patterns
+        # Intent detection by host suffix
+        self.intent_hosts = {
+            IntentType.ARTICLE: ['medium.com', 'substack.com', 'dev.to', 'wordpress.com'],
+            IntentType.SOCIAL: [
+                'twitter.com', 'instagram.com', 'linkedin.com',
+                'facebook.com', 'tiktok.com', 'reddit.com'
+            ],
+            IntentType.ECOMMERCE: ['amazon.com', 'ebay.com', 'shopify.com', 'shop'],
+            IntentType.DOCS: ['github.io', 'readthedocs.io'],
+            IntentType.MEDIA: ['youtube.com', 'vimeo.com', 'twitch.tv']
+        }
+        
+        # Intent detection patterns (URL path rules)
         self.intent_patterns = {
             IntentType.ARTICLE: [
-                r'/(article|blog|post|news|story)/',
-                r'medium\.com', r'substack\.com', r'dev\.to',
-                r'/\d{4}/\d{2}/', r'wordpress\.com'
-            ],
-            IntentType.SOCIAL: [
-                r'twitter\.com', r'instagram\.com', r'linkedin\.com',
-                r'facebook\.com', r'tiktok\.com', r'reddit\.com'
+                r'/(article|blog|post|news|story)/', r'/\d{4}/\d{2}/'
             ],
             IntentType.ECOMMERCE: [
-                r'amazon\.com', r'ebay\.com', r'shopify\.com',
-                r'/product/', r'/shop/', r'/store/', r'\.shop'
+                r'/product/', r'/shop/', r'/store/'
             ],
             IntentType.DOCS: [
-                r'/docs/', r'/documentation/', r'/api/',
-                r'github\.io', r'readthedocs\.io', r'/wiki/'
+                r'/docs/', r'/documentation/', r'/api/', r'/wiki/'
             ],
             IntentType.MEDIA: [
-                r'youtube\.com', r'vimeo\.com', r'twitch\.tv',
                 r'/gallery/', r'/photos/', r'/images/'
             ],
             IntentType.DATA: [
@@ -129,6 +230,7 @@ class EnterpriseWebCrawler:
                 r'/table/', r'/dashboard/', r'/stats/'
             ]
         }
+        self._compile_intent_patterns()
         
         # Stealth configurations by level
         self.stealth_configs = {
@@ -139,30 +241,60 @@ class EnterpriseWebCrawler:
             5: {"maximum": True, "proxy_rotation": True, "advanced_evasion": True}
         }
         
-    def _setup_logging(self) -> logging.Logger:
-        """Setup enterprise logging"""
-        logger = logging.getLogger("crawl4ai_enterprise")
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-        return logger
-        
-    def detect_intent(self, url: str, context: Optional[str] = None) -> IntentType:
-        """Intelligent intent detection from URL and context"""
-        url_lower = url.lower()
+    def _compile_intent_patterns(self):
+        """Build the host suffix lookup and a single combined path regex"""
+        # Host suffixes keyed by reversed labels: ('com', 'medium') -> ARTICLE
+        self._host_trie: Dict[Tuple[str, ...], IntentType] = {}
+        for intent_type, hosts in self.intent_hosts.items():
+            for host in hosts:
+                self._host_trie.setdefault(tuple(reversed(host.split('.'))), intent_type)
         
-        # Pattern matching
+        # Reverse index: pattern -> intents sharing it, in priority order
+        self._pattern_intents: Dict[str, List[IntentType]] = {}
         for intent_type, patterns in self.intent_patterns.items():
             for pattern in patterns:
-                import re
-                if re.search(pattern, url_lower):
-                    self.logger.info(f"🎯 Intent detected: {intent_type.value} from URL pattern")
-                    return intent_type
+                self._pattern_intents.setdefault(pattern, []).append(intent_type)
+        
+        # Zero-width lookahead groups so overlapping matches are all visited;
+        # group index follows pattern priority, so the lowest index wins
+        self._group_intents = [intents[0] for intents in self._pattern_intents.values()]
+        self._path_re = re.compile("|".join(
+            f"(?=(?P<g{i}>{pattern}))" for i, pattern in enumerate(self._pattern_intents)
+        ))
+        
+        # Memoize URL rule matching; rebuilt (and so invalidated) with the rules
+        self._match_url_intent_cached = functools.lru_cache(maxsize=4096)(self._match_url_intent)
+        
+    def _match_url_intent(self, url_lower: str, host: str) -> Tuple[Optional[IntentType], str]:
+        """Match URL host/path rules, returning the intent and which rule kind matched"""
+        # Host suffix lookup, longest suffix first
+        labels = tuple(reversed(host.split('.')))
+        for i in range(len(labels), 0, -1):
+            intent_type = self._host_trie.get(labels[:i])
+            if intent_type:
+                return intent_type, "host"
+        
+        # Path pattern matching (single pass over the URL)
+        best = None
+        for match in self._path_re.finditer(url_lower):
+            index = int(match.lastgroup[1:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        if best is not None:
+            return self._group_intents[best], "pattern"
+        return None, ""
+        
+    def detect_intent(self, url: str, context: Optional[str] = None,
+                      crawl_context: Optional[CrawlContext] = None) -> IntentType:
+        """Intelligent intent detection from URL and context"""
+        host = crawl_context.host if crawl_context else _url_host(url)
+        
+        intent_type, source = self._match_url_intent_cached(url.lower(), host)
+        if intent_type:
+            self.logger.info(f"🎯 Intent detected: {intent_type.value} from URL {source}")
+            return intent_type
         
         # Context-based detection if provided
         if context:
@@ -508,12 +640,15 @@ class EnterpriseWebCrawler:
     async def smart_crawl(self, request: CrawlRequest) -> CrawlResult:
         """Intelligent crawling with automatic optimization"""
         start_time = time.time()
+        ctx = CrawlContext.from_request(request)
         
         # Detect intent if not provided
-        if not request.intent:
-            request.intent = self.detect_intent(request.url, request.extraction_query)
+        if not ctx.intent:
+            ctx.intent = request.intent = self.detect_intent(
+                request.url, request.extraction_query, crawl_context=ctx
+            )
         
-        self.logger.info(f"🚀 Smart crawl: {request.url} (intent: {request.intent.value})")
+        self.logger.info(f"🚀 Smart crawl: {ctx.url} (intent: {ctx.intent.value}, host: {ctx.host})")
         
         try:
             # Create adaptive configuration
@@ -548,20 +683,16 @@ class EnterpriseWebCrawler:
                     }
                 )
                 
-                # Add extracted content if available
-                if hasattr(result, 'extracted_content') and result.extracted_content:
-                    crawl_result.extracted_content = result.extracted_content
-                
-                # Process intent-specific post-processing
-                if request.extraction_query:
-                    crawl_result.extracted_content = self._process_extraction_query(
-                        crawl_result.content, request.extraction_query, request.intent
-                    )
+                # Prefer query-based extraction, falling back to AI-extracted content
+                ai_extracted = getattr(result, 'extracted_content', None)
+                query_extracted = await self._process_extraction_query_async(
+                    crawl_result.content, request.extraction_query, request.intent
+                ) if request.extraction_query else None
+                crawl_result.extracted_content = query_extracted or ai_extracted
                 
                 self.logger.info(f"✅ Crawl completed in {crawl_result.performance['duration']:.2f}s")
-                return crawl_result
             else:
-                return CrawlResult(
+                crawl_result = CrawlResult(
                     status="error",
                     url=request.url,
                     error=result.error_message,
@@ -570,12 +701,45 @@ class EnterpriseWebCrawler:
                 
         except Exception as e:
             self.logger.error(f"Smart crawl failed: {e}")
-            return CrawlResult(
+            crawl_result = CrawlResult(
                 status="error",
                 url=request.url,
                 error=str(e),
                 performance={"duration": time.time() - start_time}
             )
+        
+        self._record_crawl(crawl_result)
+        return crawl_result
+    
+    def _record_crawl(self, crawl_result: CrawlResult):
+        """Record per-crawl metrics and update the running aggregates"""
+        duration = crawl_result.performance["duration"]
+        self.performance_metrics[self._perf_total] = {
+            "url": crawl_result.url,
+            "status": crawl_result.status,
+            "duration": duration
+        }
+        self._perf_total += 1
+        self._perf_success += (crawl_result.status == "success")
+        delta = duration - self._perf_mean
+        self._perf_mean += delta / self._perf_total
+        self._perf_m2 += delta * (duration - self._perf_mean)
+        self._metrics_dirty = True
+    
+    @property
+    def avg_duration(self) -> float:
+        """Mean crawl duration in seconds"""
+        return self._perf_mean
+    
+    @property
+    def duration_variance(self) -> float:
+        """Sample variance of crawl durations"""
+        return self._perf_m2 / (self._perf_total - 1) if self._perf_total > 1 else 0.0
+    
+    @property
+    def success_rate(self) -> float:
+        """Fraction of recorded crawls that succeeded"""
+        return self._perf_success / self._perf_total if self._perf_total else 0.0
     
     async def _add_ai_extraction(self, config: CrawlerRunConfig, instruction: str) -> CrawlerRunConfig:
         """Add AI extraction to configuration"""
@@ -602,6 +766,12 @@ class EnterpriseWebCrawler:
             self.logger.warning(f"AI extraction setup failed: {e}")
             return config
     
+    async def _process_extraction_query_async(self, content: str, query: str, intent: IntentType) -> Dict[str, Any]:
+        """Run extraction off the event loop for large pages so other crawls keep progressing"""
+        if len(content) > _EXTRACTION_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(self._process_extraction_query, content, query, intent)
+        return self._process_extraction_query(content, query, intent)
+    
     def _process_extraction_query(self, content: str, query: str, intent: IntentType) -> Dict[str, Any]:
         """Process extraction query based on intent"""
         query_lower = query.lower()
@@ -619,11 +789,9 @@ class EnterpriseWebCrawler:
     
     def _extract_data_elements(self, content: str, query: str) -> Dict[str, Any]:
         """Extract data-specific elements"""
-        import re
-        
         # Find tables, numbers, statistics
-        tables = re.findall(r'\|[^\n]*\|(?:\n\|[^\n]*\|)+', content)
-        numbers = re.findall(r'\d+(?:\.\d+)?%?', content)
+        tables = _first_matches(_TABLE_RE, content, 5)  # Top 5 tables
+        numbers = _first_matches(_NUMBER_RE, content, 20)  # Top 20 numbers
         
         # Find relevant sections
         query_words = query.lower().split()
@@ -637,8 +805,8 @@ class EnterpriseWebCrawler:
         
         return {
             "type": "data_extraction",
-            "tables": tables[:5],  # Top 5 tables
-            "numbers": numbers[:20],  # Top 20 numbers
+            "tables": tables,
+            "numbers": numbers,
             "relevant_data": relevant_lines[:15],
             "query": query
         }
@@ -671,10 +839,8 @@ class EnterpriseWebCrawler:
     
     def _extract_product_elements(self, content: str, query: str) -> Dict[str, Any]:
         """Extract e-commerce product elements"""
-        import re
-        
         # Find prices
-        prices = re.findall(r'\$\d+(?:\.\d{2})?|\d+(?:\.\d{2})?\s*(?:USD|EUR|GBP)', content)
+        prices = _first_matches(_PRICE_RE, content, 10)
         
         # Find product-related terms
         product_terms = ['price', 'cost', 'buy', 'purchase', 'discount', 'sale', 'review', 'rating']
@@ -687,7 +853,7 @@ class EnterpriseWebCrawler:
         
         return {
             "type": "product_extraction",
-            "prices": prices[:10],
+            "prices": prices,
             "product_info": relevant_lines[:15],
             "query": query
         }
@@ -711,75 +877,190 @@ class EnterpriseWebCrawler:
             "query": query
         }
     
-    async def batch_smart_crawl(self, requests: List[CrawlRequest], max_concurrent: int = 3) -> List[CrawlResult]:
-        """Batch processing with intelligent concurrency"""
+    async def _guarded_smart_crawl(self, request: CrawlRequest, semaphore: asyncio.Semaphore) -> CrawlResult:
+        """smart_crawl under the batch semaphore, converting exceptions to error results"""
+        async with semaphore:
+            try:
+                return await self.smart_crawl(request)
+            except Exception as e:
+                return CrawlResult(
+                    status="error",
+                    url=request.url,
+                    error=str(e)
+                )
+    
+    async def batch_smart_crawl(self, requests: List[CrawlRequest], max_concurrent: int = 3) -> AsyncIterator[CrawlResult]:
+        """Batch processing with intelligent concurrency, yielding results as they complete"""
         self.logger.info(f"📦 Batch crawling {len(requests)} URLs")
         
         semaphore = asyncio.Semaphore(max_concurrent)
+        pending = {asyncio.create_task(self._guarded_smart_crawl(req, semaphore)) for req in requests}
+        successful = 0
+        try:
+            for coro in asyncio.as_completed(pending):
+                result = await coro
+                if result.status == "success":
+                    successful += 1
+                yield result
+        finally:
+            # Consumer stopped early - don't leave crawls running
+            for task in pending:
+                task.cancel()
         
-        async def crawl_with_semaphore(request: CrawlRequest) -> CrawlResult:
-            async with semaphore:
-                return await self.smart_crawl(request)
-        
-        tasks = [crawl_with_semaphore(req) for req in requests]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.logger.info(f"✅ Batch completed: {successful}/{len(requests)} successful")
+    
+    async def batch_smart_crawl_list(self, requests: List[CrawlRequest], max_concurrent: int = 3) -> List[CrawlResult]:
+        """Batch crawl returning a list in the same order as requests (the pre-streaming API)"""
+        self.logger.info(f"📦 Batch crawling {len(requests)} URLs")
         
-        # Convert exceptions to error results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(CrawlResult(
-                    status="error",
-                    url=requests[i].url,
-                    error=str(result)
-                ))
-            else:
-                processed_results.append(result)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        results = await asyncio.gather(*(self._guarded_smart_crawl(req, semaphore) for req in requests))
         
-        successful = sum(1 for r in processed_results if r.status == "success")
+        successful = sum(1 for r in results if r.status == "success")
         self.logger.info(f"✅ Batch completed: {successful}/{len(requests)} successful")
-        
-        return processed_results
+        return list(results)
     
     async def discover_urls(self, base_url: str, query: str, max_urls: int = 20) -> List[str]:
         """Intelligent URL discovery using 0.7.x seeding features"""
+        if max_urls < 1:
+            raise ValueError("max_urls must be at least 1")
         if not ENTERPRISE_FEATURES_AVAILABLE:
             self.logger.warning("URL seeding not available - using basic discovery")
             return [base_url]
         
+        cache_key = (base_url, query, max_urls, _SEED_SCORE_THRESHOLD)
+        cached = self._discovery_cache.get(cache_key)
+        if cached and time.time() - cached[0] < _DISCOVERY_CACHE_TTL:
+            return list(cached[1])
+        
+        discover = self._discover_urls_bm25s if BM25S_AVAILABLE else self._discover_urls_seeder
         try:
-            async with AsyncUrlSeeder() as seeder:
-                config = SeedingConfig(
-                    source="sitemap",
-                    extract_head=True,
-                    query=query,
-                    scoring_method="bm25",
-                    score_threshold=0.3,
-                    max_urls=max_urls
-                )
-                
-                urls = await seeder.urls(base_url, config)
-                discovered = [url_data['url'] for url_data in urls]
-                
-                self.logger.info(f"🔍 Discovered {len(discovered)} relevant URLs")
-                return discovered
-                
+            discovered = await discover(base_url, query, max_urls)
         except Exception as e:
-            self.logger.error(f"URL discovery failed: {e}")
+            # Seeder transport errors aren't part of crawl4ai's public API; any failure falls back
+            self.logger.error("URL discovery failed: %s", e)
             return [base_url]
+        
+        self.logger.info("🔍 Discovered %d relevant URLs", len(discovered))
+        self._discovery_cache[cache_key] = (time.time(), tuple(discovered))
+        return discovered
+    
+    async def _discover_urls_seeder(self, base_url: str, query: str, max_urls: int) -> List[str]:
+        """Rank sitemap URLs with the seeder's built-in BM25 scoring"""
+        seeder = await self._get_seeder()
+        config = SeedingConfig(
+            source="sitemap",
+            extract_head=True,
+            query=query,
+            scoring_method="bm25",
+            score_threshold=_SEED_SCORE_THRESHOLD,
+            max_urls=max_urls
+        )
+        urls = await seeder.urls(base_url, config)
+        return list(map(_URL_KEY, urls))
+    
+    async def _discover_urls_bm25s(self, base_url: str, query: str, max_urls: int) -> List[str]:
+        """Rank sitemap URLs against the query with a cached BM25S index"""
+        index = await self._get_seed_index(base_url)
+        urls = index["urls"]
+        if not urls:
+            return []
+        
+        doc_ids, scores = index["retriever"].retrieve(
+            _tokenize_query(query), k=min(max_urls, len(urls)), show_progress=False,
+            backend_selection=_BM25_BACKEND
+        )
+        
+        # Raw BM25 scores are unbounded; apply the threshold relative to the best hit
+        top_score = scores[0][0]
+        if top_score <= 0:
+            return []
+        return [
+            urls[doc_id] for doc_id, score in zip(doc_ids[0], scores[0])
+            if score >= _SEED_SCORE_THRESHOLD * top_score
+        ]
+    
+    async def _get_seed_index(self, base_url: str) -> Dict[str, Any]:
+        """Fetch sitemap heads (up to _SEED_INDEX_MAX_URLS) once per base_url and build the BM25S index"""
+        cache_key = f"bm25s:{base_url}"
+        index = self.session_cache.get(cache_key)
+        if index and time.time() - index["created_at"] < _SEED_INDEX_TTL:
+            return index
+        
+        seeder = await self._get_seeder()
+        entries = await seeder.urls(base_url, SeedingConfig(
+            source="sitemap", extract_head=True, max_urls=_SEED_INDEX_MAX_URLS
+        ))
+        
+        urls = list(map(_URL_KEY, entries))
+        texts = [self._seed_entry_text(entry) for entry in entries]
+        retriever = await asyncio.to_thread(self._build_bm25_index, texts) if texts else None
+        
+        index = {"urls": urls, "retriever": retriever, "created_at": time.time()}
+        self.session_cache[cache_key] = index
+        return index
+    
+    async def _get_seeder(self) -> "AsyncUrlSeeder":
+        """Return the long-lived AsyncUrlSeeder for the running event loop, opening it once"""
+        # Callers like the Flask API run each request on its own event loop,
+        # so seeders (and their locks) are pooled per loop
+        loop = asyncio.get_running_loop()
+        seeder = self._seeders.get(loop)
+        if seeder is not None:
+            return seeder
+        lock = self._seeder_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            seeder = self._seeders.get(loop)
+            if seeder is None:
+                seeder = AsyncUrlSeeder()
+                await seeder.__aenter__()
+                self._seeders[loop] = seeder
+        return seeder
+    
+    async def aclose(self):
+        """Close the shared URL seeder for the running event loop"""
+        seeder = self._seeders.pop(asyncio.get_running_loop(), None)
+        if seeder is not None:
+            await seeder.__aexit__(None, None, None)
+    
+    @staticmethod
+    def _seed_entry_text(entry: Dict[str, Any]) -> str:
+        """Searchable text for a seeded URL: the URL plus its head title/description"""
+        head = entry.get('head_data') or {}
+        meta = head.get('meta') or {}
+        return " ".join(filter(None, [
+            entry['url'],
+            head.get('title'),
+            meta.get('description'),
+            meta.get('keywords')
+        ]))
+    
+    @staticmethod
+    def _build_bm25_index(texts: List[str]) -> "bm25s.BM25":
+        """Precompute BM25 scores for every (term, document) pair"""
+        retriever = bm25s.BM25(backend=_BM25_BACKEND)
+        retriever.index(bm25s.tokenize(texts, stopwords="en", show_progress=False), show_progress=False)
+        return retriever
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance and usage metrics"""
-        return {
-            "cache_size": len(self.session_cache),
-            "total_crawls": len(self.performance_metrics),
-            "avg_duration": sum(m.get("duration", 0) for m in self.performance_metrics.values()) / max(len(self.performance_metrics), 1),
-            "success_rate": sum(1 for m in self.performance_metrics.values() if m.get("status") == "success") / max(len(self.performance_metrics), 1),
-            "features_available": {
-                "enterprise": ENTERPRISE_FEATURES_AVAILABLE,
-                "advanced_stealth": ADVANCED_STEALTH_AVAILABLE
+        if self._perf_total == 0:
+            return {"cache_size": len(self.session_cache), "total_crawls": 0,
+                    "avg_duration": 0.0, "success_rate": 0.0, "features_available": dict(_FEATURES_AVAILABLE)}
+        
+        if self._metrics_dirty:
+            # Clear first so a crawl recorded mid-rebuild marks the cache dirty again
+            self._metrics_dirty = False
+            self._metrics_cache = {
+                "total_crawls": self._perf_total,
+                "avg_duration": self.avg_duration,
+                "success_rate": self.success_rate
             }
-        }
+        
+        # Fresh dicts per call (nested feature flags included): the cached aggregates are
+        # never handed out, and only the cache size (which moves without a crawl) is read each time
+        return {"cache_size": len(self.session_cache), **self._metrics_cache,
+                "features_available": dict(_FEATURES_AVAILABLE)}
 
 # Export the main class
-__all__ = ["EnterpriseWebCrawler", "CrawlRequest", "CrawlResult", "IntentType"]
\ No newline at end of file
+__all__ = ["EnterpriseWebCrawler", "CrawlRequest", "CrawlResult", "CrawlContext", "IntentType"]
\ No newline at end of file
@@ -7,13 +7,17 @@ A powerful command-line interface that demonstrates all crawl4ai capabilities
 
 import asyncio
 import argparse
+import hashlib
+import inspect
 import json
+import os
 import sys
+import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 try:
-    from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, LLMConfig, BrowserConfig
+    from crawl4ai import CrawlerRunConfig, LLMConfig, BrowserConfig
     from crawl4ai.extraction_strategy import LLMExtractionStrategy
     from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
     from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
@@ -25,6 +29,13 @@ try:
         DEEP_CRAWL_AVAILABLE = False
         print(f"⚠️  Deep crawl features not available: {e}")
         print("   Try: pip install crawl4ai[all] or pip install crawl4ai[deep-crawl]")
+    try:
+        from crawl4ai import MemoryAdaptiveDispatcher
+        DISPATCHER_AVAILABLE = True
+    except ImportError:
+        DISPATCHER_AVAILABLE = False
+    # Per-URL config lists in arun_many (selected via url_matcher) arrived in 0.7.3
+    MULTI_CONFIG_AVAILABLE = "url_matcher" in inspect.signature(CrawlerRunConfig).parameters
     try:
         from crawl4ai import UndetectedAdapter, RateLimiter, ProxyConfig, RoundRobinProxyStrategy
         ADVANCED_STEALTH_AVAILABLE = True
@@ -34,23 +45,333 @@ except ImportError:
     print("❌ crawl4ai not installed. Install with: pip install crawl4ai")
     sys.exit(1)
 
+try:
+    from selectolax.parser import HTMLParser
+    from crawl4ai.utils import normalize_url, get_base_domain, is_external_url
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+from crawl4ai_common import BoundedDict, PooledCrawlerMixin, dump_json_bytes, minify_js
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Transport/browser failures worth retrying as a single-page crawl
+_retriable = [asyncio.TimeoutError, ConnectionError]
+try:
+    from aiohttp import ClientError
+    _retriable.append(ClientError)
+except ImportError:
+    pass
+try:
+    from playwright.async_api import Error as PlaywrightError
+    _retriable.append(PlaywrightError)
+except ImportError:
+    pass
+_RETRIABLE = tuple(_retriable)
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
 import logging
 import random
+import re
+from itertools import islice
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import List
 
-class Crawl4AIPOCTool:
+_STEALTH_UAS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
+)
+
+# Separators accepted between entries of a proxy list
+_PROXY_SPLIT = re.compile(r"[,\n\r]+")
+
+# Page scripts sent with each crawl, defined once rather than per call
+_DEFAULT_DYN_JS = """
+// Wait for dynamic content
+await new Promise(resolve => setTimeout(resolve, 1000));
+
+// Scroll to load more content
+window.scrollTo(0, document.body.scrollHeight);
+
+// Click "Load More" buttons if they exist
+const loadMoreButtons = document.querySelectorAll('[data-testid="load-more"], .load-more, button:contains("Load More")');
+loadMoreButtons.forEach(btn => btn.click());
+"""
+
+# Identifies media elements and stores them on window for retrieval
+_MEDIA_JS = """
+// Identify all media elements
+const images = Array.from(document.querySelectorAll('img')).map(img => ({
+    src: img.src,
+    alt: img.alt,
+    width: img.naturalWidth,
+    height: img.naturalHeight
+}));
+
+const videos = Array.from(document.querySelectorAll('video, iframe[src*="youtube"], iframe[src*="vimeo"]')).map(vid => ({
+    src: vid.src,
+    type: vid.tagName.toLowerCase()
+}));
+
+// Store in window for retrieval
+window.crawl4ai_media_data = { images, videos };
+"""
+
+# Human-like JavaScript behavior for stealth_crawl (enhanced for v0.7.x)
+_STEALTH_JS_V07_SRC = """
+// Advanced human behavior simulation for v0.7.x
+const simulateAdvancedHuman = async () => {
+    // Randomize timing to avoid detection patterns
+    const wait = (ms) => new Promise(r => setTimeout(r, ms + Math.random() * ms * 0.5));
+    
+    // Simulate viewport interaction
+    const viewport = {
+        width: window.innerWidth,
+        height: window.innerHeight
+    };
+    
+    // Mouse movements with realistic acceleration
+    const moveCount = Math.floor(Math.random() * 4) + 3;
+    for (let i = 0; i < moveCount; i++) {
+        const x = Math.random() * viewport.width * 0.8 + viewport.width * 0.1;
+        const y = Math.random() * viewport.height * 0.8 + viewport.height * 0.1;
+        
+        // Create realistic mouse event
+        const event = new MouseEvent('mousemove', {
+            clientX: x,
+            clientY: y,
+            bubbles: true,
+            cancelable: true
+        });
+        document.dispatchEvent(event);
+        
+        await wait(150);
+    }
+    
+    // Natural scrolling patterns
+    const totalHeight = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
+    const scrollSteps = Math.min(Math.floor(totalHeight / viewport.height), 4) + 1;
+    
+    for (let i = 0; i < scrollSteps; i++) {
+        const progress = i / (scrollSteps - 1);
+        const scrollY = totalHeight * progress * 0.8; // Don't scroll to absolute bottom
+        
+        window.scrollTo({
+            top: scrollY, 
+            behavior: 'smooth'
+        });
+        
+        await wait(800);
+        
+        // Occasional random micro-scrolls
+        if (Math.random() > 0.7) {
+            window.scrollBy(0, (Math.random() - 0.5) * 50);
+            await wait(200);
+        }
+    }
+    
+    // Return to readable position
+    window.scrollTo({top: viewport.height * 0.1, behavior: 'smooth'});
+    await wait(500);
+};
+
+// Execute enhanced human simulation
+await simulateAdvancedHuman();
+"""
+
+# Minified once at import: fewer bytes shipped to the browser on every navigation
+_STEALTH_JS_V07 = minify_js(_STEALTH_JS_V07_SRC)
+
+# Max page-level LLM extractions in flight during ai_enhanced_deep_crawl
+# (tune to the provider's rate limit with AI_CONCURRENCY)
+_LLM_EXTRACTION_CONCURRENCY = int(os.getenv("AI_CONCURRENCY", "8"))
+
+# LLM response cache: entries live a week; by default only near-deterministic calls are cached
+_AI_CACHE_MODES = ("readWrite", "readOnly", "writeOnly", "off")
+_AI_CACHE_TTL = 7 * 24 * 3600
+_AI_CACHE_MAX_TEMPERATURE = 0.1
+_AI_CACHE_DIR = Path.home() / ".cache" / "crawl4ai_poc" / "ai_responses"
+# In-memory fallback size when diskcache isn't installed (the API server's poc lives for the process)
+_AI_CACHE_MAX_ENTRIES = 512
+# ISO-8601 timestamps are dropped before hashing so re-renders of a page still hit
+_VOLATILE_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?")
+
+# Stateless, so one instance serves every crawl config
+_DEFAULT_MD = DefaultMarkdownGenerator()
+
+# A sentence ends at . ! or ? followed by whitespace, or at a line break
+_SENTENCE_RE = re.compile(r"[^\n]+?(?:[.!?](?=\s|$)|(?=\n)|$)")
+
+def _iter_sentences(content: str):
+    """Yield stripped, non-empty sentences without building a list of the document"""
+    for m in _SENTENCE_RE.finditer(content):
+        sentence = m.group(0).strip()
+        if sentence:
+            yield sentence
+
+def _prompt_cache_usage(strategy) -> Dict[str, int]:
+    """Sum prompt and provider-cached prompt tokens across an LLM strategy's calls"""
+    prompt_tokens = cached_tokens = 0
+    for usage in getattr(strategy, "usages", ()):
+        details = usage.prompt_tokens_details or {}
+        prompt_tokens += usage.prompt_tokens
+        cached_tokens += details.get("cached_tokens") or details.get("cache_read_input_tokens") or 0
+    return {"prompt_tokens": prompt_tokens, "cached_prompt_tokens": cached_tokens}
+
+def _ai_cache_key(markdown: str, extraction_strategy, chunking_strategy) -> str:
+    """Stable cache key for an LLM extraction of normalized page markdown under one strategy setup"""
+    normalized = " ".join(_VOLATILE_RE.sub("", markdown).split())
+    params = {
+        "provider": extraction_strategy.llm_config.provider,
+        **{name: getattr(extraction_strategy, name, None) for name in (
+            "instruction", "extraction_type", "schema", "input_format", "extra_args",
+            "apply_chunking", "chunk_token_threshold", "overlap_rate", "word_token_rate"
+        )},
+        "chunking": [type(chunking_strategy).__name__, vars(chunking_strategy)],
+    }
+    digest = hashlib.sha256()
+    for part in (normalized, json.dumps(params, sort_keys=True, default=str)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f"response:{digest.hexdigest()}"
+
+def _dump_json_line(data) -> bytes:
+    """Serialize to one compact UTF-8 JSON line (NDJSON record)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+def _keyword_pattern(words, word_start: bool = False, ascii_only: bool = False) -> Optional[re.Pattern]:
+    """Compile keywords into one case-insensitive matcher (None if no words).
+    With word_start, keywords only match at the start of a word, so "install" hits "installed" but not "reinstall"."""
+    words = sorted(set(words), key=len, reverse=True)
+    if not words:
+        return None
+    alternation = "|".join(map(re.escape, words))
+    if word_start:
+        alternation = rf"\b(?:{alternation})"
+    # ASCII-only text needs no Unicode case folding, which is the slower matching path
+    flags = re.IGNORECASE | (re.ASCII if ascii_only else 0)
+    return re.compile(alternation, flags)
+
+if DEEP_CRAWL_AVAILABLE and SELECTOLAX_AVAILABLE:
+    class SelectolaxScrapingStrategy(LXMLWebScrapingStrategy):
+        """Scraping strategy that harvests links/cleaned HTML with selectolax, falling back to lxml.
+        Opt-in: it returns no media/tables and skips word_count_threshold filtering."""
+        
+        _STRIP_TAGS = ("script", "style", "noscript", "iframe", "svg")
+        # Content-selection options only the lxml scraper implements
+        _LXML_ONLY_OPTIONS = ("css_selector", "excluded_tags", "excluded_selector", "target_elements")
+        
+        def _scrap(self, url: str, html: str, **kwargs) -> Dict[str, Any]:
+            if not html:
+                return None
+            if any(kwargs.get(option) for option in self._LXML_ONLY_OPTIONS):
+                return super()._scrap(url, html, **kwargs)
+            try:
+                tree = HTMLParser(html)
+                base_node = tree.css_first("head > base[href]")
+                base_url = (base_node.attributes.get("href") or "").strip() if base_node else ""
+                base_url = base_url or url
+                base_domain = get_base_domain(url)
+                exclude_domains = set(kwargs.get("exclude_domains", []))
+                exclude_external = kwargs.get("exclude_external_links", False)
+                
+                internal, external = {}, {}
+                for node in tree.css("a[href]"):
+                    href = (node.attributes.get("href") or "").strip()
+                    if not href:
+                        continue
+                    normalized = normalize_url(href, base_url)
+                    if not normalized:
+                        continue
+                    link = {
+                        "href": normalized,
+                        "text": node.text(strip=True),
+                        "title": (node.attributes.get("title") or "").strip(),
+                        "base_domain": base_domain,
+                        "intrinsic_score": 0,
+                    }
+                    if is_external_url(normalized, base_domain):
+                        link_domain = get_base_domain(normalized)
+                        if exclude_external or link_domain in exclude_domains:
+                            continue
+                        link["base_domain"] = link_domain
+                        external.setdefault(normalized, link)
+                    else:
+                        internal.setdefault(normalized, link)
+                
+                title_node = tree.css_first("title")
+                desc_node = tree.css_first('meta[name="description"]')
+                metadata = {
+                    "title": title_node.text(strip=True) if title_node else "",
+                    "description": (desc_node.attributes.get("content") or "") if desc_node else "",
+                }
+                
+                tree.strip_tags(list(self._STRIP_TAGS))
+                root = tree.body or tree.root
+                return {
+                    "cleaned_html": root.html if root is not None else "",
+                    "success": True,
+                    "media": {"images": [], "videos": [], "audios": [], "tables": []},
+                    "links": {"internal": list(internal.values()), "external": list(external.values())},
+                    "metadata": metadata,
+                }
+            except Exception as e:
+                self._log("warning", f"selectolax parse failed, using lxml: {e}", "SCRAPE")
+                return super()._scrap(url, html, **kwargs)
+
+@dataclass
+class ContentStats:
+    """Sentence/word/paragraph figures for a document, each computed at most once"""
+    content: str
+    
+    def iter_sentences(self):
+        return _iter_sentences(self.content)
+    
+    @cached_property
+    def sentence_count(self) -> int:
+        return sum(1 for _ in self.iter_sentences())
+    
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.content.split())
+    
+    @cached_property
+    def paragraph_count(self) -> int:
+        # Same as len(content.split('\n\n')) without building the list
+        return self.content.count('\n\n') + 1
+
+class Crawl4AIPOCTool(PooledCrawlerMixin):
     """POC CLI tool showcasing all crawl4ai features"""
     
-    def __init__(self):
+    def __init__(self, cache_mode: str = "readWrite"):
         self.setup_logging()
-        self.stealth_user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15"
-        ]
+        
+        # LLM response cache (diskcache when installed, otherwise in-process), opened lazily
+        if cache_mode not in _AI_CACHE_MODES:
+            raise ValueError(f"cache_mode must be one of {_AI_CACHE_MODES}")
+        self.cache_mode = cache_mode
+        self._ai_cache = None
+        
+        # Shared browser per event loop, started on first use (see PooledCrawlerMixin)
+        super().__init__()
+        self._stealth_cfg = None
         
     def setup_logging(self):
         """Configure logging"""
@@ -60,35 +381,94 @@ class Crawl4AIPOCTool:
         )
         self.logger = logging.getLogger(__name__)
     
-    async def simple_crawl(self, url: str, output_format: str = "markdown", use_stealth: bool = False) -> Dict[str, Any]:
-        """Basic crawling with output format options"""
-        print(f"🕷️  Simple crawl: {url}")
+    def _default_stealth_config(self, user_agent: Optional[str] = None, **overrides) -> CrawlerRunConfig:
+        """Clone of the memoized default stealth config with the given (or a freshly rotated) user agent"""
+        if self._stealth_cfg is None:
+            self._stealth_cfg = self.create_stealth_config(simulate_user=True, magic=True)
+        return self._stealth_cfg.clone(user_agent=user_agent or random.choice(_STEALTH_UAS), **overrides)
+    
+    def _ai_cache_store(self):
+        """Open the response cache on first use"""
+        if self._ai_cache is None:
+            self._ai_cache = (diskcache.Cache(str(_AI_CACHE_DIR)) if DISKCACHE_AVAILABLE
+                              else BoundedDict(maxlen=_AI_CACHE_MAX_ENTRIES))
+        return self._ai_cache
+    
+    def _ai_cache_get(self, key: str) -> Optional[str]:
+        if self.cache_mode not in ("readWrite", "readOnly"):
+            return None
+        cache = self._ai_cache_store()
+        if DISKCACHE_AVAILABLE:
+            return cache.get(key)
+        entry = cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def _ai_cache_set(self, key: str, value: str):
+        if self.cache_mode not in ("readWrite", "writeOnly"):
+            return
+        cache = self._ai_cache_store()
+        if DISKCACHE_AVAILABLE:
+            cache.set(key, value, expire=_AI_CACHE_TTL)
+        else:
+            cache[key] = (time.monotonic() + _AI_CACHE_TTL, value)
+    
+    async def _llm_extract(self, url: str, markdown: str, extraction_strategy, chunking_strategy,
+                           cacheable: Optional[bool] = None) -> str:
+        """Run blocking LLM extraction over page markdown off the event loop, through the response cache.
+        cacheable=None caches only near-deterministic (low-temperature) calls; True/False overrides that."""
+        if cacheable is None:
+            temperature = (extraction_strategy.extra_args or {}).get("temperature")
+            cacheable = temperature is not None and temperature <= _AI_CACHE_MAX_TEMPERATURE
+        cacheable = cacheable and self.cache_mode != "off"
+        if cacheable:
+            key = _ai_cache_key(markdown, extraction_strategy, chunking_strategy)
+            cached = self._ai_cache_get(key)
+            if cached is not None:
+                print(f"⚡ LLM response cache hit: {url}")
+                return cached
         
+        sections = chunking_strategy.chunk(markdown)
+        blocks = await asyncio.to_thread(extraction_strategy.run, url, sections)
+        extracted = json.dumps(blocks, indent=4, default=str, ensure_ascii=False)
+        # Failed calls come back as error blocks; don't pin those for a week
+        if cacheable and not any(isinstance(b, dict) and b.get("error") for b in blocks):
+            self._ai_cache_set(key, extracted)
+        return extracted
+    
+    async def _run(self, url: str, config: CrawlerRunConfig, *, use_stealth: bool = False,
+                   overlay: Dict[str, Any] = None, label: str = "crawl"):
+        """Crawl url on the shared crawler, trying the stealth config (plus overlay) first when requested"""
+        crawler = await self._get_crawler()
         if use_stealth:
             try:
                 # Use v0.7.x stealth features
-                stealth_config = self.create_stealth_config(simulate_user=True, magic=True)
-                if output_format == "markdown":
-                    stealth_config.markdown_generator = DefaultMarkdownGenerator()
+                stealth_config = self._default_stealth_config()
+                for attr, value in (overlay or {}).items():
+                    setattr(stealth_config, attr, value)
                 
-                print("🥷 Using stealth mode for simple crawl")
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url, config=stealth_config)
+                print(f"🥷 Using stealth mode for {label}")
+                return await crawler.arun(url, config=stealth_config)
             except Exception as stealth_error:
                 print(f"⚠️  Stealth mode failed: {stealth_error}")
                 print("🔄 Falling back to standard crawling...")
-                config = CrawlerRunConfig()
-                if output_format == "markdown":
-                    config.markdown_generator = DefaultMarkdownGenerator()
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url, config=config)
-        else:
-            config = CrawlerRunConfig()
-            if output_format == "markdown":
-                config.markdown_generator = DefaultMarkdownGenerator()
-            async with AsyncWebCrawler() as crawler:
-                result = await crawler.arun(url, config=config)
+        return await crawler.arun(url, config=config)
+    
+    async def simple_crawl(self, url: str, output_format: str = "markdown", use_stealth: bool = False) -> Dict[str, Any]:
+        """Basic crawling with output format options"""
+        print(f"🕷️  Simple crawl: {url}")
+        
+        config = CrawlerRunConfig()
+        overlay = {}
+        if output_format == "markdown":
+            config.markdown_generator = overlay["markdown_generator"] = _DEFAULT_MD
+        result = await self._run(url, config, use_stealth=use_stealth, overlay=overlay, label="simple crawl")
             
+        return self._format_simple_result(result, output_format)
+    
+    def _format_simple_result(self, result, output_format: str = "markdown") -> Dict[str, Any]:
+        """Shape a crawl4ai result the way simple_crawl reports it"""
         if result.success:
             return {
                 "status": "success",
@@ -109,44 +489,17 @@ class Crawl4AIPOCTool:
         """Advanced crawling with JavaScript execution"""
         print(f"🚀 Advanced crawl with JS: {url}")
         
-        default_js = """
-        // Wait for dynamic content
-        await new Promise(resolve => setTimeout(resolve, 1000));
-        
-        // Scroll to load more content
-        window.scrollTo(0, document.body.scrollHeight);
-        
-        // Click "Load More" buttons if they exist
-        const loadMoreButtons = document.querySelectorAll('[data-testid="load-more"], .load-more, button:contains("Load More")');
-        loadMoreButtons.forEach(btn => btn.click());
-        """
-        
         config = CrawlerRunConfig(
-            js_code=js_code or default_js,
+            js_code=js_code or _DEFAULT_DYN_JS,
             delay_before_return_html=wait_time,  # Use delay_before_return_html instead of wait_for
-            markdown_generator=DefaultMarkdownGenerator()
+            markdown_generator=_DEFAULT_MD
         )
         
-        if use_stealth:
-            try:
-                # Use v0.7.x stealth features
-                stealth_config = self.create_stealth_config(simulate_user=True, magic=True)
-                # Merge the JS code with stealth config
-                stealth_config.js_code = js_code or default_js
-                stealth_config.delay_before_return_html = wait_time
-                stealth_config.markdown_generator = DefaultMarkdownGenerator()
-                
-                print("🥷 Using stealth mode for advanced crawl")
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url, config=stealth_config)
-            except Exception as stealth_error:
-                print(f"⚠️  Stealth mode failed: {stealth_error}")
-                print("🔄 Falling back to standard crawling...")
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url, config=config)
-        else:
-            async with AsyncWebCrawler() as crawler:
-                result = await crawler.arun(url, config=config)
+        result = await self._run(url, config, use_stealth=use_stealth, label="advanced crawl", overlay={
+            "js_code": config.js_code,
+            "delay_before_return_html": wait_time,
+            "markdown_generator": _DEFAULT_MD,
+        })
             
         if result.success:
             return {
@@ -167,54 +520,86 @@ class Crawl4AIPOCTool:
         
         # Simple configuration for extraction
         config = CrawlerRunConfig(
-            markdown_generator=DefaultMarkdownGenerator(),
+            markdown_generator=_DEFAULT_MD,
             word_count_threshold=50,  # Include smaller content chunks
             verbose=True
         )
         
-        async with AsyncWebCrawler() as crawler:
-            result = await crawler.arun(url, config=config)
+        crawler = await self._get_crawler()
+        result = await crawler.arun(url, config=config)
             
-            if result.success:
-                # Simple keyword-based extraction (POC level)
-                content = result.markdown.lower()
-                query_words = extraction_query.lower().split()
+        if result.success:
+            # Simple keyword-based extraction (POC level)
+            query_words = extraction_query.lower().split()
                 
-                relevant_chunks = []
+            query_pattern = _keyword_pattern(query_words, ascii_only=result.markdown.isascii())
+            relevant_chunks = []
+            if query_pattern:
                 for chunk in result.markdown.split('\n\n'):
-                    if any(word in chunk.lower() for word in query_words):
+                    if query_pattern.search(chunk):
                         relevant_chunks.append(chunk.strip())
                 
-                return {
-                    "status": "success",
-                    "url": result.url,
-                    "extraction_query": extraction_query,
-                    "relevant_content": relevant_chunks[:10],  # Top 10 relevant chunks
-                    "total_chunks_found": len(relevant_chunks),
-                    "full_content": result.markdown
-                }
-            else:
-                return {"status": "error", "error": result.error_message}
+            return {
+                "status": "success",
+                "url": result.url,
+                "extraction_query": extraction_query,
+                "relevant_content": relevant_chunks[:10],  # Top 10 relevant chunks
+                "total_chunks_found": len(relevant_chunks),
+                "full_content": result.markdown
+            }
+        else:
+            return {"status": "error", "error": result.error_message}
     
-    async def batch_crawl(self, urls: list, max_concurrent: int = 3) -> Dict[str, Any]:
-        """Batch crawl multiple URLs with concurrency control"""
+    async def batch_crawl(self, urls: list, max_concurrent: int = 3, use_stealth: bool = False) -> Dict[str, Any]:
+        """Batch crawl multiple URLs through one browser with crawl4ai's dispatcher"""
         print(f"📦 Batch crawling {len(urls)} URLs (max concurrent: {max_concurrent})")
         
-        semaphore = asyncio.Semaphore(max_concurrent)
-        results = []
-        
-        async def crawl_single(url: str):
-            async with semaphore:
-                try:
-                    result = await self.simple_crawl(url)
-                    return {"url": url, "result": result}
-                except Exception as e:
-                    return {"url": url, "result": {"status": "error", "error": str(e)}}
+        if use_stealth and MULTI_CONFIG_AVAILABLE:
+            # Draw every URL's user agent in one call, then build one config per agent
+            # that claims its URLs (crawl4ai picks the first config whose url_matcher hits)
+            urls_by_ua = {}
+            for url, ua in zip(urls, random.choices(_STEALTH_UAS, k=len(urls))):
+                urls_by_ua.setdefault(ua, set()).add(url)
+            config = [
+                self._default_stealth_config(
+                    ua, url_matcher=frozenset(ua_urls).__contains__, markdown_generator=_DEFAULT_MD, stream=True
+                )
+                for ua, ua_urls in urls_by_ua.items()
+            ]
+        elif use_stealth:
+            # Older crawl4ai takes a single config: one random user agent for the whole batch
+            config = self._default_stealth_config(markdown_generator=_DEFAULT_MD, stream=True)
+        else:
+            config = CrawlerRunConfig(markdown_generator=_DEFAULT_MD, stream=True)
         
-        tasks = [crawl_single(url) for url in urls]
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        dispatcher = MemoryAdaptiveDispatcher(max_session_permit=max_concurrent) if DISPATCHER_AVAILABLE else None
         
-        successful = sum(1 for r in batch_results if not isinstance(r, Exception) and r.get("result", {}).get("status") == "success")
+        # Stream results so each raw CrawlResult (full HTML included) is summarized
+        # and released as it completes instead of buffering the whole batch
+        batch_results = []
+        successful = 0
+        # Submitted URLs still awaiting a result; a redirected page may report its final
+        # URL, so match either URL crawl4ai carries and key the entry by the input URL
+        pending = set(urls)
+        try:
+            crawler = await self._get_crawler()
+            async for result in await crawler.arun_many(urls, config=config, dispatcher=dispatcher):
+                summary = self._format_simple_result(result)
+                if summary["status"] == "success":
+                    successful += 1
+                    # Per-page media inventories dominate batch payloads; use crawl_with_media_download for them
+                    summary.pop("media", None)
+                input_url = next(
+                    (u for u in (result.url, getattr(result, "redirected_url", None)) if u in pending),
+                    result.url
+                )
+                pending.discard(input_url)
+                batch_results.append({"url": input_url, "result": summary})
+        except Exception as e:
+            batch_results.extend(
+                {"url": url, "result": {"status": "error", "error": str(e)}}
+                for url in urls if url in pending
+            )
         failed = len(urls) - successful
         
         return {
@@ -229,82 +614,65 @@ class Crawl4AIPOCTool:
         """Crawl with media detection and optional download"""
         print(f"📸 Media-aware crawl: {url}")
         
-        # JavaScript to identify and interact with media elements
-        media_js = """
-        // Identify all media elements
-        const images = Array.from(document.querySelectorAll('img')).map(img => ({
-            src: img.src,
-            alt: img.alt,
-            width: img.naturalWidth,
-            height: img.naturalHeight
-        }));
-        
-        const videos = Array.from(document.querySelectorAll('video, iframe[src*="youtube"], iframe[src*="vimeo"]')).map(vid => ({
-            src: vid.src,
-            type: vid.tagName.toLowerCase()
-        }));
-        
-        // Store in window for retrieval
-        window.crawl4ai_media_data = { images, videos };
-        """
-        
         config = CrawlerRunConfig(
-            js_code=media_js,
+            js_code=_MEDIA_JS,
             delay_before_return_html=2.0,  # Use delay_before_return_html instead of wait_for
-            markdown_generator=DefaultMarkdownGenerator()
+            markdown_generator=_DEFAULT_MD
         )
         
-        async with AsyncWebCrawler() as crawler:
-            result = await crawler.arun(url, config=config)
+        crawler = await self._get_crawler()
+        result = await crawler.arun(url, config=config)
             
-            if result.success:
-                return {
-                    "status": "success",
-                    "url": result.url,
-                    "content": result.markdown,
-                    "images_found": len(result.media.get("images", [])),
-                    "videos_found": len(result.media.get("videos", [])),
-                    "media": result.media,
-                    "download_enabled": {
-                        "images": download_images,
-                        "videos": download_videos
-                    }
+        if result.success:
+            return {
+                "status": "success",
+                "url": result.url,
+                "content": result.markdown,
+                "images_found": len(result.media.get("images", [])),
+                "videos_found": len(result.media.get("videos", [])),
+                "media": result.media,
+                "download_enabled": {
+                    "images": download_images,
+                    "videos": download_videos
                 }
-            else:
-                return {"status": "error", "error": result.error_message}
+            }
+        else:
+            return {"status": "error", "error": result.error_message}
     
-    async def interactive_crawl(self, url: str, question: str) -> Dict[str, Any]:
-        """Interactive crawl with Q&A capability (simulated)"""
+    async def interactive_crawl(self, url: str, question: str, content: Optional[str] = None) -> Dict[str, Any]:
+        """Interactive crawl with Q&A capability (simulated); pass content to skip re-crawling url"""
         print(f"❓ Interactive crawl: {url}")
         print(f"   Question: {question}")
         
-        # First, get the content
-        content_result = await self.simple_crawl(url)
-        
-        if content_result["status"] != "success":
-            return content_result
+        # First, get the content unless the caller already has it
+        if content is None:
+            content_result = await self.simple_crawl(url)
+            
+            if content_result["status"] != "success":
+                return content_result
+            content = content_result["content"]
         
         # Simple keyword-based answer simulation (POC level)
-        content = content_result["content"].lower()
-        question_lower = question.lower()
+        question_words = frozenset(w for w in re.findall(r"\w+", question.lower()) if len(w) > 2)
+        question_pattern = _keyword_pattern(question_words, word_start=True, ascii_only=content.isascii())
         
-        # Extract relevant sentences
-        sentences = content_result["content"].split('. ')
+        # Extract relevant sentences (only the top 3 are reported)
         relevant_sentences = []
         
-        question_words = question_lower.split()
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            relevance_score = sum(1 for word in question_words if word in sentence_lower)
-            if relevance_score >= 2:  # At least 2 matching words
-                relevant_sentences.append(sentence.strip())
+        if question_pattern:
+            relevant_sentences = list(islice(
+                (sentence for sentence in _iter_sentences(content)
+                 # At least 2 matching words
+                 if len({m.lower() for m in question_pattern.findall(sentence)}) >= 2),
+                3
+            ))
         
         return {
             "status": "success",
             "url": url,
             "question": question,
             "answer_candidate": relevant_sentences[:3],  # Top 3 relevant sentences
-            "full_content": content_result["content"],
+            "full_content": content,
             "confidence": "simulated_poc_level"
         }
     
@@ -341,36 +709,29 @@ class Crawl4AIPOCTool:
                 }
             )
             
+            # Extraction runs after the crawl so identical page/instruction pairs
+            # can be answered from the response cache
             config = CrawlerRunConfig(
-                extraction_strategy=extraction_strategy,
-                markdown_generator=DefaultMarkdownGenerator(),
+                markdown_generator=_DEFAULT_MD,
                 verbose=True
             )
             
-            if use_stealth:
-                try:
-                    # Use v0.7.x stealth features
-                    stealth_config = self.create_stealth_config(simulate_user=True, magic=True)
-                    # Merge AI config with stealth config
-                    stealth_config.extraction_strategy = extraction_strategy
-                    stealth_config.markdown_generator = DefaultMarkdownGenerator()
-                    stealth_config.verbose = True
-                    
-                    print("🥷 Using stealth mode for AI-powered crawl")
-                    async with AsyncWebCrawler() as crawler:
-                        result = await crawler.arun(url, config=stealth_config)
-                except Exception as stealth_error:
-                    print(f"⚠️  Stealth mode failed: {stealth_error}")
-                    print("🔄 Falling back to standard crawling...")
-                    async with AsyncWebCrawler() as crawler:
-                        result = await crawler.arun(url, config=config)
-            else:
-                async with AsyncWebCrawler() as crawler:
-                    result = await crawler.arun(url, config=config)
+            # Merge AI config with stealth config when stealth is requested
+            result = await self._run(url, config, use_stealth=use_stealth, label="AI-powered crawl", overlay={
+                "markdown_generator": _DEFAULT_MD,
+                "verbose": True,
+            })
                 
             if result.success:
                 # Extract AI-generated insights
-                extracted_content = result.extracted_content if hasattr(result, 'extracted_content') else "No structured extraction available"
+                if result.markdown:
+                    extracted_content = await self._llm_extract(
+                        result.url, result.markdown, extraction_strategy, config.chunking_strategy
+                    )
+                else:
+                    extracted_content = "No structured extraction available"
+                prompt_cache = _prompt_cache_usage(extraction_strategy)
+                self.logger.info(f"Prompt cache: {prompt_cache['cached_prompt_tokens']}/{prompt_cache['prompt_tokens']} prompt tokens served from cache")
                 
                 return {
                     "status": "success",
@@ -381,7 +742,8 @@ class Crawl4AIPOCTool:
                     "markdown_content": result.markdown,
                     "metadata": result.metadata,
                     "links": result.links,
-                    "usage_info": "Check extraction_strategy.show_usage() for token usage"
+                    "usage_info": "Check extraction_strategy.show_usage() for token usage",
+                    "prompt_cache": prompt_cache
                 }
             else:
                 return {
@@ -433,41 +795,53 @@ class Crawl4AIPOCTool:
     def _simulate_ai_analysis(self, content: str, instruction: str) -> str:
         """Simulate AI analysis for fallback mode"""
         instruction_lower = instruction.lower()
-        content_lower = content.lower()
-        
-        # Extract key sentences based on instruction
-        sentences = content.split('. ')
+        stats = ContentStats(content)
         relevant_sentences = []
         
         # Simple keyword matching for different instruction types
         if any(word in instruction_lower for word in ['summarize', 'summary', 'main points']):
             # Find sentences with key terms
-            for sentence in sentences[:10]:  # First 10 sentences for summary
-                if len(sentence.strip()) > 20:  # Avoid short fragments
-                    relevant_sentences.append(sentence.strip())
+            for sentence in islice(stats.iter_sentences(), 10):  # First 10 sentences for summary
+                if len(sentence) > 20:  # Avoid short fragments
+                    relevant_sentences.append(sentence)
             
             return f"Summary (simulated): {' '.join(relevant_sentences[:3])}..."
             
         elif any(word in instruction_lower for word in ['extract', 'find', 'identify']):
             # Extract based on instruction keywords
-            instruction_words = instruction_lower.split()
-            for sentence in sentences:
-                sentence_lower = sentence.lower()
-                if any(word in sentence_lower for word in instruction_words if len(word) > 3):
-                    relevant_sentences.append(sentence.strip())
+            instruction_pattern = _keyword_pattern(
+                (word for word in instruction_lower.split() if len(word) > 3), ascii_only=content.isascii()
+            )
+            if instruction_pattern:
+                relevant_sentences = list(islice(
+                    (s for s in stats.iter_sentences() if instruction_pattern.search(s)), 5
+                ))
             
             return f"Extracted content (simulated): {' '.join(relevant_sentences[:5])}"
             
         elif any(word in instruction_lower for word in ['analyze', 'analysis', 'insights']):
             # Provide basic analysis
-            word_count = len(content.split())
-            paragraph_count = len(content.split('\n\n'))
-            
-            return f"Analysis (simulated): Content contains {word_count} words and {paragraph_count} paragraphs. Key topics identified through keyword frequency analysis."
+            return f"Analysis (simulated): Content contains {stats.word_count} words and {stats.paragraph_count} paragraphs. Key topics identified through keyword frequency analysis."
             
         else:
             # Generic extraction
-            return f"AI Processing (simulated): Processed content with instruction '{instruction}'. Found {len(sentences)} sentences for analysis."
+            return f"AI Processing (simulated): Processed content with instruction '{instruction}'. Found {stats.sentence_count} sentences for analysis."
+    
+    async def _extract_pages(self, results, extraction_strategy, chunking_strategy):
+        """Run LLM extraction over crawled pages concurrently, storing it on each result.
+        Deep-crawl page analyses are always cached (subject to cache_mode) so repeated crawls reuse them."""
+        sem = asyncio.BoundedSemaphore(_LLM_EXTRACTION_CONCURRENCY)
+        
+        async def _extract(result):
+            async with sem:
+                try:
+                    result.extracted_content = await self._llm_extract(
+                        result.url, result.markdown, extraction_strategy, chunking_strategy, cacheable=True
+                    )
+                except Exception as e:
+                    self.logger.warning(f"LLM extraction failed for {result.url}: {e}")
+        
+        await asyncio.gather(*(_extract(r) for r in results if r.success and r.markdown))
     
     async def ai_enhanced_deep_crawl(self, 
                                    url: str, 
@@ -476,7 +850,8 @@ class Crawl4AIPOCTool:
                                    max_depth: int = 2,
                                    strategy: str = "bfs",
                                    provider: str = "groq/llama-3.3-70b-versatile",
-                                   api_token: str = None) -> Dict[str, Any]:
+                                   api_token: str = None,
+                                   use_selectolax: bool = False) -> Dict[str, Any]:
         """AI-First Deep Crawler - MANDATORY AI processing on every page"""
         print(f"🤖 AI-Enhanced Deep Crawl: {url}")
         print(f"   Instruction: {extraction_instruction}")
@@ -538,12 +913,18 @@ class Crawl4AIPOCTool:
                     score_threshold=0.3
                 )
             
-            # Create comprehensive crawler configuration
+            # selectolax handles link-heavy pages faster but drops media/tables, so it's opt-in
+            if use_selectolax and SELECTOLAX_AVAILABLE:
+                scraping_strategy = SelectolaxScrapingStrategy()
+            else:
+                scraping_strategy = LXMLWebScrapingStrategy()
+            
+            # Create comprehensive crawler configuration; LLM extraction runs after the
+            # crawl so page extractions overlap instead of blocking the page loop
             config = CrawlerRunConfig(
                 deep_crawl_strategy=deep_strategy,
-                extraction_strategy=extraction_strategy,
-                scraping_strategy=LXMLWebScrapingStrategy(),
-                markdown_generator=DefaultMarkdownGenerator(),
+                scraping_strategy=scraping_strategy,
+                markdown_generator=_DEFAULT_MD,
                 verbose=True,
                 delay_before_return_html=1.0,  # Allow content to load
                 simulate_user=True,
@@ -554,8 +935,8 @@ class Crawl4AIPOCTool:
             print(f"   Deep crawl strategy: {type(deep_strategy).__name__}")
             print(f"   External links: {'Allowed' if hasattr(deep_strategy, 'include_external') and deep_strategy.include_external else 'Blocked'}")
             
-            async with AsyncWebCrawler() as crawler:
-                results = await crawler.arun(url, config=config)
+            crawler = await self._get_crawler()
+            results = await crawler.arun(url, config=config)
             
             # Debug: Check what we got back
             print(f"🔍 Deep crawl returned: {type(results)}")
@@ -566,15 +947,22 @@ class Crawl4AIPOCTool:
             
             print(f"   Total pages retrieved: {len(results)}")
             
+            await self._extract_pages(results, extraction_strategy, config.chunking_strategy)
+            prompt_cache = _prompt_cache_usage(extraction_strategy)
+            print(f"   Prompt cache: {prompt_cache['cached_prompt_tokens']}/{prompt_cache['prompt_tokens']} prompt tokens served from cache")
+            
             # Process AI insights from all pages
             all_insights = []
-            successful_pages = []
-            total_content = ""
+            # Keyed by URL so redirects/canonicalized revisits are reported once
+            pages_by_url = {}
+            total_content_length = 0
             
             print(f"📊 Processing AI insights from {len(results)} pages...")
             
             for i, result in enumerate(results):
-                if result.success:
+                if result.success and result.url in pages_by_url:
+                    print(f"↩️  Page {i+1}/{len(results)}: {result.url} - already analyzed, skipping duplicate")
+                elif result.success:
                     page_info = {
                         "url": result.url,
                         "title": result.metadata.get("title", ""),
@@ -583,23 +971,28 @@ class Crawl4AIPOCTool:
                         "ai_insights": result.extracted_content if result.extracted_content else "AI processing failed",
                         "links_found": len(result.links) if result.links else 0
                     }
-                    successful_pages.append(page_info)
+                    pages_by_url[result.url] = page_info
                     all_insights.append(result.extracted_content or "No insights extracted")
-                    total_content += f"\n\n=== PAGE {i+1}: {result.url} ===\n{result.markdown}"
+                    total_content_length += page_info["content_length"]
                     
                     print(f"✅ Page {i+1}/{len(results)}: {result.url} - AI insights generated")
                 else:
                     print(f"❌ Page {i+1}/{len(results)}: Failed to crawl")
             
+            successful_pages = list(pages_by_url.values())
+            
             # AI-powered synthesis of all insights
             if all_insights:
+                # Report previews are sliced once and shared by both templates below
+                previews = [insight[:200] for insight in all_insights[:5]]
+                page_insight_lines = "\n".join(f"Page {i+1}: {insight}" for i, insight in enumerate(all_insights))
                 synthesis_instruction = f"""
                 Based on the following AI insights from {len(successful_pages)} crawled pages, create a comprehensive synthesis report.
                 
                 Original instruction: {extraction_instruction}
                 
                 AI Insights from each page:
-                {chr(10).join(f"Page {i+1}: {insight}" for i, insight in enumerate(all_insights))}
+                {page_insight_lines}
                 
                 Provide:
                 1. **Executive Summary**: Key findings across all pages
@@ -629,13 +1022,14 @@ class Crawl4AIPOCTool:
                     )
                     
                     # Process synthesis directly without URL crawling
-                    combined_content = f"AI INSIGHTS SYNTHESIS:\n\n{chr(10).join(all_insights)}"
+                    combined_content = "AI INSIGHTS SYNTHESIS:\n\n" + "\n".join(all_insights)
                     
                     # Create synthesis directly without complex crawl result simulation
                     # Use the combined insights for direct processing
                     print(f"   Synthesizing {len(all_insights)} AI insights...")
                     
                     # Create a simple synthesis from the collected insights
+                    key_insight_lines = "\n".join([f"- {preview}..." for preview in previews])
                     final_synthesis = f"""
 **AI-Enhanced Deep Crawl Synthesis Report**
 
@@ -643,7 +1037,7 @@ class Crawl4AIPOCTool:
 Successfully crawled {len(successful_pages)} pages with AI analysis.
 
 **Key Insights:**
-{chr(10).join([f"- {insight[:200]}..." for insight in all_insights[:5]])}
+{key_insight_lines}
 
 **Summary:**
 This deep crawl analyzed {len(successful_pages)} pages and extracted valuable insights using AI processing on each page.
@@ -652,6 +1046,8 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
                 except Exception as synthesis_error:
                     print(f"⚠️  Synthesis failed: {synthesis_error}")
                     # Fallback: create manual synthesis
+                    finding_lines = "\n".join([f"• Page {i+1}: {preview}..." for i, preview in enumerate(previews)])
+                    page_lines = "\n".join([f"• {page['url']} ({page['content_length']} chars)" for page in successful_pages[:10]])
                     final_synthesis = f"""
                         **AI-Enhanced Deep Crawl Synthesis Report**
                         
@@ -659,10 +1055,10 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
                         Successfully crawled {len(successful_pages)} pages with AI analysis on each page.
                         
                         **Key Findings:**
-                        {chr(10).join(f"• Page {i+1}: {insight[:200]}..." for i, insight in enumerate(all_insights[:5]))}
+                        {finding_lines}
                         
                         **Pages Analyzed:**
-                        {chr(10).join(f"• {page['url']} ({page['content_length']} chars)" for page in successful_pages[:10])}
+                        {page_lines}
                         
                         **Recommendation:** Review individual page insights for detailed analysis.
                         """
@@ -685,7 +1081,8 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
                 "ai_provider": provider,
                 "individual_pages": successful_pages,
                 "ai_synthesis": final_synthesis,
-                "total_content_length": len(total_content),
+                "total_content_length": total_content_length,
+                "prompt_cache": prompt_cache,
                 "metadata": {
                     "deep_crawl_enabled": True,
                     "ai_processing_mandatory": True,
@@ -693,7 +1090,7 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
                 }
             }
             
-        except Exception as e:
+        except _RETRIABLE as e:
             print(f"💥 AI-Enhanced Deep Crawl failed: {e}")
             print("🔄 Falling back to single-page AI crawl...")
             
@@ -709,18 +1106,26 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
                     "error": f"Both AI-enhanced deep crawl and fallback failed: {e}",
                     "crawl_type": "ai_enhanced_deep_crawl_failed"
                 }
+        except Exception as e:
+            # Not a transport/browser failure: a single-page retry would fail the same way
+            print(f"💥 AI-Enhanced Deep Crawl failed: {e}")
+            return {
+                "status": "error",
+                "error": f"AI-enhanced deep crawl failed: {e}",
+                "crawl_type": "ai_enhanced_deep_crawl_failed"
+            }
     
     def create_stealth_config(self, 
                              user_agent_mode: str = "random",
                              simulate_user: bool = True,
                              magic: bool = True,
-                             delay_range: tuple = (1.5, 3.0)) -> CrawlerRunConfig:
+                             delay_range: tuple = (1.5, 3.0),
+                             user_agent: Optional[str] = None) -> CrawlerRunConfig:
         """Create advanced stealth crawler configuration for v0.7.x"""
         
-        # Select random user agent if mode is random
-        user_agent = None
-        if user_agent_mode == "random":
-            user_agent = random.choice(self.stealth_user_agents)
+        # Select random user agent if mode is random (unless the caller already picked one)
+        if user_agent is None and user_agent_mode == "random":
+            user_agent = random.choice(_STEALTH_UAS)
         
         try:
             # Use the new v0.7.x stealth approach with CrawlerRunConfig
@@ -756,7 +1161,7 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
             self.logger.warning("Falling back to basic crawler config with user agent only")
             
             fallback_config = CrawlerRunConfig(
-                user_agent=user_agent if user_agent else random.choice(self.stealth_user_agents),
+                user_agent=user_agent if user_agent else random.choice(_STEALTH_UAS),
                 delay_before_return_html=1.0,
                 verbose=True
             )
@@ -770,15 +1175,9 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
         if not proxy_string:
             return []
         
-        # Handle both comma-separated and newline-separated proxies
-        proxies = []
-        for proxy in proxy_string.replace('\n', ',').split(','):
-            proxy = proxy.strip()
-            if proxy:
-                # Support both ip:port and ip:port:user:pass formats
-                proxies.append(proxy)
-        
-        return proxies
+        # Handle both comma-separated and newline-separated proxies;
+        # supports both ip:port and ip:port:user:pass formats
+        return [p for p in (s.strip() for s in _PROXY_SPLIT.split(proxy_string)) if p]
     
     async def stealth_crawl(self, 
                            url: str, 
@@ -801,71 +1200,10 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
             delay_range=delays
         )
         
-        # Human-like JavaScript behavior (enhanced for v0.7.x)
-        stealth_js = """
-        // Advanced human behavior simulation for v0.7.x
-        const simulateAdvancedHuman = async () => {
-            // Randomize timing to avoid detection patterns
-            const wait = (ms) => new Promise(r => setTimeout(r, ms + Math.random() * ms * 0.5));
-            
-            // Simulate viewport interaction
-            const viewport = {
-                width: window.innerWidth,
-                height: window.innerHeight
-            };
-            
-            // Mouse movements with realistic acceleration
-            const moveCount = Math.floor(Math.random() * 4) + 3;
-            for (let i = 0; i < moveCount; i++) {
-                const x = Math.random() * viewport.width * 0.8 + viewport.width * 0.1;
-                const y = Math.random() * viewport.height * 0.8 + viewport.height * 0.1;
-                
-                // Create realistic mouse event
-                const event = new MouseEvent('mousemove', {
-                    clientX: x,
-                    clientY: y,
-                    bubbles: true,
-                    cancelable: true
-                });
-                document.dispatchEvent(event);
-                
-                await wait(150);
-            }
-            
-            // Natural scrolling patterns
-            const totalHeight = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
-            const scrollSteps = Math.min(Math.floor(totalHeight / viewport.height), 4) + 1;
-            
-            for (let i = 0; i < scrollSteps; i++) {
-                const progress = i / (scrollSteps - 1);
-                const scrollY = totalHeight * progress * 0.8; // Don't scroll to absolute bottom
-                
-                window.scrollTo({
-                    top: scrollY, 
-                    behavior: 'smooth'
-                });
-                
-                await wait(800);
-                
-                // Occasional random micro-scrolls
-                if (Math.random() > 0.7) {
-                    window.scrollBy(0, (Math.random() - 0.5) * 50);
-                    await wait(200);
-                }
-            }
-            
-            // Return to readable position
-            window.scrollTo({top: viewport.height * 0.1, behavior: 'smooth'});
-            await wait(500);
-        };
-        
-        // Execute enhanced human simulation
-        await simulateAdvancedHuman();
-        """
         
         # Add JavaScript to stealth config if human simulation enabled
         if simulate_human:
-            stealth_config.js_code = stealth_js
+            stealth_config.js_code = _STEALTH_JS_V07
         
         try:
             # Use the modern v0.7.x approach with all stealth features built into CrawlerRunConfig
@@ -876,8 +1214,8 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
             print(f"  • Navigator override: enabled")
             print(f"  • Delays: {delays[0]}-{delays[1]}s")
             
-            async with AsyncWebCrawler() as crawler:
-                result = await crawler.arun(url, config=stealth_config)
+            crawler = await self._get_crawler()
+            result = await crawler.arun(url, config=stealth_config)
             
             if result.success:
                 return {
@@ -919,25 +1257,46 @@ This deep crawl analyzed {len(successful_pages)} pages and extracted valuable in
                 "suggestion": "Try with max_stealth=False or check proxy configuration"
             }
     
-    def save_results(self, results: Dict[str, Any], output_file: str):
+    async def save_results(self, results: Dict[str, Any], output_file: str):
         """Save results to file"""
-        output_path = Path(output_file)
-        
-        if output_path.suffix.lower() == '.json':
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-        else:
-            # Save as text/markdown
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if isinstance(results.get('content'), str):
-                    f.write(results['content'])
-                else:
-                    f.write(json.dumps(results, indent=2, ensure_ascii=False))
-        
+        # Serialization and the write are blocking; run them off the event loop
+        output_path = await asyncio.to_thread(self._write_results, results, Path(output_file))
         print(f"💾 Results saved to: {output_path.absolute()}")
+    
+    def _write_results(self, results: Dict[str, Any], output_path: Path) -> Path:
+        """Serialize results to output_path based on its suffix, replacing it atomically"""
+        # Write next to the target and rename over it, so a crash never leaves a truncated file
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        suffix = output_path.suffix.lower()
+        try:
+            if suffix == '.json':
+                tmp_path.write_bytes(dump_json_bytes(results))
+            elif suffix == '.ndjson':
+                # Summary first, then one record per page so large crawls are written incrementally
+                records_key = next((k for k in ('individual_pages', 'results') if isinstance(results.get(k), list)), None)
+                with open(tmp_path, 'wb') as f:
+                    f.write(_dump_json_line({k: v for k, v in results.items() if k != records_key}))
+                    for record in results.get(records_key) or ():
+                        f.write(_dump_json_line(record))
+            elif isinstance(results.get('content'), str):
+                # Save as text/markdown
+                tmp_path.write_bytes(results['content'].encode('utf-8'))
+            else:
+                tmp_path.write_bytes(dump_json_bytes(results))
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return output_path
 
+def _write_lines(lines: List[str]):
+    """Emit buffered CLI output with a single write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+@lru_cache(maxsize=1)
 def create_parser():
-    """Create command line argument parser"""
+    """Create command line argument parser (built once, reused by later calls)"""
     parser = argparse.ArgumentParser(
         description="Crawl4AI POC - Comprehensive web scraping demonstration",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -981,6 +1340,11 @@ Examples:
         """
     )
     
+    # Options only some subcommands define, so main() can read them directly
+    parser.set_defaults(stealth=False, api_token=None, proxy_list=None, output=None)
+    parser.add_argument('--cache', choices=_AI_CACHE_MODES, default='readWrite',
+                        help='LLM response cache mode (applies to every command)')
+    
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Simple crawl
@@ -1008,6 +1372,7 @@ Examples:
     batch_parser = subparsers.add_parser('batch', help='Batch crawl multiple URLs')
     batch_parser.add_argument('urls', nargs='+', help='URLs to crawl')
     batch_parser.add_argument('--concurrent', type=int, default=3, help='Max concurrent crawls')
+    batch_parser.add_argument('--stealth', action='store_true', help='Enable stealth mode (rotated user agent per URL)')
     batch_parser.add_argument('--output', '-o', help='Save results to file')
     
     # Media crawl
@@ -1031,6 +1396,8 @@ Examples:
                           help='LLM provider: groq/llama-3.3-70b-versatile, openai/gpt-4o, anthropic/claude-3-5-sonnet, gemini/gemini-1.5-pro, ollama/llama3.2')
     ai_parser.add_argument('--api-token', help='API token for cloud providers (not needed for Ollama)')
     ai_parser.add_argument('--stealth', action='store_true', help='Enable stealth mode')
+    # Also accepted after the subcommand; SUPPRESS keeps it from overriding a top-level --cache
+    ai_parser.add_argument('--cache', choices=_AI_CACHE_MODES, default=argparse.SUPPRESS, help='LLM response cache mode')
     ai_parser.add_argument('--output', '-o', help='Save results to file')
     
     # Stealth crawl - dedicated stealth command
@@ -1056,21 +1423,21 @@ async def main():
         parser.print_help()
         return
     
-    tool = Crawl4AIPOCTool()
+    tool = Crawl4AIPOCTool(cache_mode=args.cache)
     results = None
     
     try:
         if args.command == 'simple':
-            results = await tool.simple_crawl(args.url, args.format, getattr(args, 'stealth', False))
+            results = await tool.simple_crawl(args.url, args.format, args.stealth)
             
         elif args.command == 'advanced':
-            results = await tool.advanced_crawl_with_js(args.url, args.js, args.wait, getattr(args, 'stealth', False))
+            results = await tool.advanced_crawl_with_js(args.url, args.js, args.wait, args.stealth)
             
         elif args.command == 'extract':
             results = await tool.crawl_with_extraction(args.url, args.query)
             
         elif args.command == 'batch':
-            results = await tool.batch_crawl(args.urls, args.concurrent)
+            results = await tool.batch_crawl(args.urls, args.concurrent, args.stealth)
             
         elif args.command == 'media':
             results = await tool.crawl_with_media_download(args.url, args.images, args.videos)
@@ -1079,106 +1446,112 @@ async def main():
             results = await tool.interactive_crawl(args.url, args.question)
             
         elif args.command == 'ai':
-            results = await tool.ai_powered_crawl(args.url, args.instruction, args.provider, getattr(args, 'api_token', None), getattr(args, 'stealth', False))
+            results = await tool.ai_powered_crawl(args.url, args.instruction, args.provider, args.api_token, args.stealth)
             
         elif args.command == 'stealth':
-            custom_delays = (args.delay_min, args.delay_max) if hasattr(args, 'delay_min') else None
+            custom_delays = (args.delay_min, args.delay_max)
             results = await tool.stealth_crawl(
                 url=args.url,
                 max_stealth=args.max_stealth,
-                proxy_list=getattr(args, 'proxy_list', None),
+                proxy_list=args.proxy_list,
                 user_agent_mode=args.user_agent,
                 simulate_human=args.human_simulation,
                 custom_delays=custom_delays
             )
         
-        # Print results summary
+        # Print results summary, buffered into one write
         if results:
-            print("\n" + "="*50)
-            print("RESULTS SUMMARY")
-            print("="*50)
+            lines = []
+            lines.append("\n" + "="*50)
+            lines.append("RESULTS SUMMARY")
+            lines.append("="*50)
             
             if results.get("status") in ["success", "completed"]:
-                print("✅ Crawl successful!")
+                lines.append("✅ Crawl successful!")
                 if "url" in results:
-                    print(f"📍 URL: {results['url']}")
+                    lines.append(f"📍 URL: {results['url']}")
                 if "title" in results:
-                    print(f"📰 Title: {results['title']}")
+                    lines.append(f"📰 Title: {results['title']}")
                 if "total_urls" in results:
-                    print(f"📊 Batch: {results['successful']}/{results['total_urls']} successful")
+                    lines.append(f"📊 Batch: {results['successful']}/{results['total_urls']} successful")
                 if "question" in results:
-                    print(f"❓ Question: {results['question']}")
-                    print(f"💡 Answer candidates: {len(results.get('answer_candidate', []))}")
+                    lines.append(f"❓ Question: {results['question']}")
+                    lines.append(f"💡 Answer candidates: {len(results.get('answer_candidate', []))}")
                 if "extraction_query" in results:
-                    print(f"🔍 Query: {results['extraction_query']}")
-                    print(f"📝 Relevant chunks: {results['total_chunks_found']}")
+                    lines.append(f"🔍 Query: {results['extraction_query']}")
+                    lines.append(f"📝 Relevant chunks: {results['total_chunks_found']}")
                 if "images_found" in results:
-                    print(f"📸 Images: {results['images_found']}, Videos: {results['videos_found']}")
+                    lines.append(f"📸 Images: {results['images_found']}, Videos: {results['videos_found']}")
                 if "provider" in results:
-                    print(f"🤖 AI Provider: {results['provider']}")
-                    print(f"📋 Instruction: {results['instruction']}")
+                    lines.append(f"🤖 AI Provider: {results['provider']}")
+                    lines.append(f"📋 Instruction: {results['instruction']}")
                     if results.get('fallback_mode'):
-                        print(f"⚠️  Note: {results.get('note', 'Running in fallback mode')}")
+                        lines.append(f"⚠️  Note: {results.get('note', 'Running in fallback mode')}")
                 if "stealth_features" in results:
-                    print(f"🥷 Stealth Features:")
+                    lines.append(f"🥷 Stealth Features:")
                     features = results["stealth_features"]
                     if features.get("undetected_adapter"):
-                        print(f"  ✅ UndetectedAdapter enabled")
+                        lines.append(f"  ✅ UndetectedAdapter enabled")
                     if features.get("user_agent_randomization"):
-                        print(f"  ✅ User Agent randomization")
+                        lines.append(f"  ✅ User Agent randomization")
                     if features.get("human_simulation"):
-                        print(f"  ✅ Human behavior simulation")
+                        lines.append(f"  ✅ Human behavior simulation")
                     if features.get("proxy_rotation"):
-                        print(f"  ✅ Proxy rotation")
+                        lines.append(f"  ✅ Proxy rotation")
                     if features.get("viewport_randomization"):
-                        print(f"  ✅ Viewport randomization")
+                        lines.append(f"  ✅ Viewport randomization")
                     if features.get("rate_limiting"):
-                        print(f"  ✅ Rate limiting")
+                        lines.append(f"  ✅ Rate limiting")
                     if "browser_fingerprint" in results:
                         fingerprint = results["browser_fingerprint"]
-                        print(f"🔍 Browser Fingerprint:")
-                        print(f"  📱 User Agent: {fingerprint.get('user_agent', 'default')[:50]}...")
-                        print(f"  🖥️  Viewport: {fingerprint.get('viewport', 'default')}")
+                        lines.append(f"🔍 Browser Fingerprint:")
+                        lines.append(f"  📱 User Agent: {fingerprint.get('user_agent', 'default')[:50]}...")
+                        lines.append(f"  🖥️  Viewport: {fingerprint.get('viewport', 'default')}")
                         if fingerprint.get("proxy_used"):
-                            print(f"  🌐 Proxy: enabled")
+                            lines.append(f"  🌐 Proxy: enabled")
             else:
-                print("❌ Crawl failed!")
-                print(f"🚫 Error: {results.get('error', 'Unknown error')}")
+                lines.append("❌ Crawl failed!")
+                lines.append(f"🚫 Error: {results.get('error', 'Unknown error')}")
                 if results.get('stealth_attempted'):
-                    print("🛡️  Stealth mode was attempted")
+                    lines.append("🛡️  Stealth mode was attempted")
                 if results.get('suggestion'):
-                    print(f"💡 Suggestion: {results['suggestion']}")
+                    lines.append(f"💡 Suggestion: {results['suggestion']}")
             
             # Save to file if requested
-            if hasattr(args, 'output') and args.output:
-                tool.save_results(results, args.output)
+            if args.output:
+                _write_lines(lines)
+                await tool.save_results(results, args.output)
             else:
                 # Print content preview - prioritize AI extraction for AI commands
                 if "ai_extraction" in results and results["ai_extraction"]:
                     ai_content = results["ai_extraction"]
-                    print(f"\n🤖 AI Extraction:")
-                    print("-" * 30)
+                    lines.append(f"\n🤖 AI Extraction:")
+                    lines.append("-" * 30)
                     if len(ai_content) > 500:
-                        print(f"{ai_content[:500]}...")
-                        print(f"\n[AI extraction truncated - {len(ai_content)} total chars]")
+                        lines.append(f"{ai_content[:500]}...")
+                        lines.append(f"\n[AI extraction truncated - {len(ai_content)} total chars]")
                     else:
-                        print(ai_content)
+                        lines.append(ai_content)
                 
                 # Print regular content preview
                 content = results.get('content', '') or results.get('markdown_content', '')
                 if content and len(content) > 500:
-                    print(f"\n📄 Content preview ({len(content)} chars):")
-                    print("-" * 30)
-                    print(content[:500] + "...")
+                    lines.append(f"\n📄 Content preview ({len(content)} chars):")
+                    lines.append("-" * 30)
+                    lines.append(content[:500] + "...")
                 elif content:
-                    print(f"\n📄 Content ({len(content)} chars):")
-                    print("-" * 30)
-                    print(content)
+                    lines.append(f"\n📄 Content ({len(content)} chars):")
+                    lines.append("-" * 30)
+                    lines.append(content)
+                
+                _write_lines(lines)
     
     except Exception as e:
         print(f"💥 Unexpected error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await tool.aclose()
 
 if __name__ == "__main__":
     print("🕷️  Crawl4AI POC Tool - Comprehensive Web Scraping Demonstration")
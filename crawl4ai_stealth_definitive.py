@@ -7,22 +7,282 @@ Based on official Crawl4AI 0.7.x documentation and working examples
 """
 
 import asyncio
-import json
+import copy
 import logging
 import random
+import re
+import sys
 import time
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
 try:
-    from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, BrowserConfig
+    from crawl4ai import CrawlerRunConfig, BrowserConfig
     from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 except ImportError:
     print("❌ crawl4ai not installed. Install with: pip install crawl4ai")
     raise
 
-@dataclass
+from crawl4ai_common import PooledCrawlerMixin, dump_json_bytes, minify_js
+
+def _setup_module_logger(logger: logging.Logger) -> logging.Logger:
+    """Attach the stealth log handler once, at import"""
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+    return logger
+
+_LOGGER = _setup_module_logger(logging.getLogger("crawl4ai_stealth"))
+
+# Max stealth levels probed at once against the same origin
+_LEVEL_TEST_CONCURRENCY = 3
+# Levels benchmarked side by side to find the cheapest one that gets through
+_BENCHMARK_LEVELS = (3, 4, 5)
+# Default tabs in flight for bulk crawls; returns diminish past ~50
+_BULK_CONCURRENCY = 20
+
+# Stateless markdown generator shared by every crawl
+_MARKDOWN_GEN = DefaultMarkdownGenerator()
+
+# Shared browser settings; UA rotation happens per run in CrawlerRunConfig
+_BROWSER_CONFIG = BrowserConfig(
+    headless=True,
+    browser_type="chromium",
+    viewport_width=1920,
+    viewport_height=1080,
+    accept_downloads=False,
+    java_script_enabled=True
+)
+
+# Definitive bot-challenge phrases vs. signs of real product content
+_CHALLENGE_RE = re.compile("|".join(map(re.escape, (
+    'complete o captcha', 'i\'m not a robot', 'verify you are human',
+    'bot detection', 'access denied', 'blocked', 'suspicious activity',
+    'security check', 'verification required', 'parece que você acessou nosso site de uma forma'
+))), re.IGNORECASE)
+_PRODUCT_RE = re.compile(r"produto|preço|comprar|adicionar", re.IGNORECASE)
+# Benchmark success indicators
+_SUCCESS_RE = re.compile(r"celular|smartphone|produto|preco|price", re.IGNORECASE)
+_CAPTCHA_RE = re.compile(r"captcha", re.IGNORECASE)
+_BLOCK_RE = re.compile(r"bloqueado|blocked", re.IGNORECASE)
+
+# Product-card container on Magazine Luiza listings; lets the benchmark return once cards render
+_MAGALU_PRODUCT_SELECTOR = "[data-testid='product-card'], .sc-ProductCard"
+
+# Level-5 behaviour script, built once at import rather than per config
+_STEALTH_JS_RAW = """
+// Advanced stealth behavior simulation with CDN/edge bypass techniques
+(async () => {
+    const wait = (ms) => new Promise(r => setTimeout(r, ms + Math.random() * ms * 0.4));
+
+    // 1. Override webdriver detection
+    if (navigator.webdriver) {
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined,
+        });
+    }
+
+    // 2. Simulate realistic viewport and screen properties
+    const viewport = {
+        width: window.innerWidth,
+        height: window.innerHeight
+    };
+
+    // 3. Add realistic browser plugins simulation
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => ({
+            length: 3,
+            0: { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
+            1: { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
+            2: { name: 'Native Client', filename: 'internal-nacl-plugin' }
+        })
+    });
+
+    // 4. Simulate realistic language preferences (Brazilian Portuguese)
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['pt-BR', 'pt', 'en-US', 'en']
+    });
+
+    // 5. Wait for initial page load (CDN detection often checks immediate behavior)
+    await wait(3000);
+
+    // 1. Natural mouse movement patterns
+    const mouseEvents = ['mousemove', 'mouseenter', 'mouseleave'];
+    for (let i = 0; i < 8; i++) {
+        const x = Math.random() * viewport.width * 0.9 + viewport.width * 0.05;
+        const y = Math.random() * viewport.height * 0.9 + viewport.height * 0.05;
+
+        // Create realistic mouse movement
+        const event = new MouseEvent('mousemove', {
+            clientX: x,
+            clientY: y,
+            bubbles: true,
+            cancelable: true,
+            view: window
+        });
+        document.dispatchEvent(event);
+        await wait(16); // one frame; real move events fire at ~60Hz
+    }
+
+    // 2. Human reading pattern scrolling
+    const totalHeight = Math.max(
+        document.body.scrollHeight,
+        document.documentElement.scrollHeight,
+        document.body.offsetHeight,
+        document.documentElement.offsetHeight,
+        document.body.clientHeight,
+        document.documentElement.clientHeight
+    );
+
+    const scrollSteps = Math.min(Math.floor(totalHeight / viewport.height), 8);
+
+    for (let i = 0; i < scrollSteps; i++) {
+        const progress = i / Math.max(scrollSteps - 1, 1);
+        const targetY = totalHeight * progress * 0.85; // Don't scroll to absolute bottom
+
+        window.scrollTo({
+            top: targetY,
+            behavior: 'smooth'
+        });
+
+        await wait(400);
+
+        // Occasional micro-adjustments (human behavior)
+        if (Math.random() > 0.65) {
+            const microAdjust = (Math.random() - 0.5) * 100;
+            window.scrollBy(0, microAdjust);
+            await wait(350);
+        }
+
+        // Interact with page elements occasionally
+        if (Math.random() > 0.8) {
+            const clickableElements = document.querySelectorAll('button, a, input, [role="button"]');
+            if (clickableElements.length > 0) {
+                const randomElement = clickableElements[Math.floor(Math.random() * Math.min(clickableElements.length, 3))];
+                if (randomElement && randomElement.offsetHeight > 0) {
+                    // Simulate hover without clicking
+                    const hoverEvent = new MouseEvent('mouseenter', {
+                        bubbles: true,
+                        cancelable: true,
+                        view: window
+                    });
+                    randomElement.dispatchEvent(hoverEvent);
+                    await wait(200);
+                }
+            }
+        }
+    }
+
+    // 3. Return to optimal reading position
+    const readingPosition = Math.min(viewport.height * 0.3, totalHeight * 0.1);
+    window.scrollTo({
+        top: readingPosition,
+        behavior: 'smooth'
+    });
+    await wait(800);
+
+    // 4. Close any overlays or popups that might interfere
+    const overlaySelectors = [
+        '.popup', '.modal', '.overlay', '.cookie-banner', 
+        '.newsletter-popup', '[data-testid*="popup"]',
+        '[class*="modal"]', '[class*="overlay"]'
+    ];
+
+    overlaySelectors.forEach(selector => {
+        const overlays = document.querySelectorAll(selector);
+        overlays.forEach(overlay => {
+            const closeBtn = overlay.querySelector('.close, .dismiss, [aria-label*="close" i], .fa-times, .x-button, [data-testid*="close"]');
+            if (closeBtn) {
+                closeBtn.click();
+            } else if (overlay.style) {
+                overlay.style.display = 'none';
+            }
+        });
+    });
+
+    // 5. Advanced CDN bypass techniques
+
+    // A) Header consistency simulation (CDN often checks request headers vs JS environment)
+    if (navigator.language !== 'pt-BR') {
+        Object.defineProperty(navigator, 'language', {
+            get: () => 'pt-BR',
+            configurable: false
+        });
+    }
+
+    // B) Simulate genuine browser timing patterns
+    window.performance.mark('page-interaction-start');
+
+    // C) Override common bot detection methods
+    Object.defineProperty(window, 'outerHeight', {
+        get: () => window.innerHeight
+    });
+    Object.defineProperty(window, 'outerWidth', {
+        get: () => window.innerWidth  
+    });
+
+    // D) Simulate realistic timezone and language consistency
+    const timezone = Intl.DateTimeFormat().resolvedOptions().timeZone;
+    if (timezone !== 'America/Sao_Paulo') {
+        // Override timezone to match Brazilian target
+        Object.defineProperty(Intl.DateTimeFormat.prototype, 'resolvedOptions', {
+            value: function() { 
+                return { ...this.constructor.prototype.resolvedOptions.call(this), timeZone: 'America/Sao_Paulo' }; 
+            }
+        });
+    }
+
+    // E) Advanced fingerprint consistency (installed once, survives SPA re-navigation)
+    if (!HTMLCanvasElement.prototype.__patched) {
+        HTMLCanvasElement.prototype.__patched = true;
+        const originalGetContext = HTMLCanvasElement.prototype.getContext;
+        HTMLCanvasElement.prototype.getContext = function(contextType, ...args) {
+            if (contextType === '2d') {
+                const context = originalGetContext.apply(this, arguments);
+                // Add noise to prevent canvas fingerprinting
+                if (context) {
+                    const originalGetImageData = context.getImageData;
+                    context.getImageData = function() {
+                        const imageData = originalGetImageData.apply(this, arguments);
+                        if (imageData && imageData.data && imageData.data.length > 1) {
+                            // Fingerprints hash the whole buffer, so one flipped byte is enough
+                            imageData.data[0] ^= 1;
+                            imageData.data[1] ^= 1;
+                        }
+                        return imageData;
+                    };
+                }
+                return context;
+            }
+            return originalGetContext.apply(this, arguments);
+        };
+    }
+
+    // 6. Final human behavior - random focus events
+    const focusableElements = document.querySelectorAll('input, button, a, select, textarea');
+    if (focusableElements.length > 0) {
+        const randomFocusable = focusableElements[Math.floor(Math.random() * Math.min(focusableElements.length, 5))];
+        if (randomFocusable && randomFocusable.offsetHeight > 0) {
+            randomFocusable.focus();
+            await wait(300);
+            randomFocusable.blur();
+        }
+    }
+})();
+"""
+# Payload actually sent over CDP: comments and whitespace stripped once at import
+_STEALTH_JS_MIN = minify_js(_STEALTH_JS_RAW)
+
+# Slotted dataclasses need 3.10+; the README still promises 3.8
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class StealthResult:
     """Stealth crawl result with detailed metrics"""
     success: bool
@@ -35,14 +295,16 @@ class StealthResult:
     error: Optional[str] = None
     metadata: Optional[Dict] = None
 
-class Crawl4AIStealthEngine:
+class Crawl4AIStealthEngine(PooledCrawlerMixin):
     """Definitive stealth crawler using proven 0.7.x techniques"""
     
+    _browser_config = _BROWSER_CONFIG
+    
     def __init__(self):
-        self.logger = self._setup_logging()
+        self.logger = _LOGGER
         
         # Enhanced user agents optimized for Brazilian e-commerce sites
-        self.stealth_user_agents = [
+        self.stealth_user_agents = (
             # Chrome variants (most common in Brazil)
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
@@ -55,7 +317,7 @@ class Crawl4AIStealthEngine:
             "Mozilla/5.0 (Linux; Android 13; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Mobile Safari/537.36",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15"
-        ]
+        )
         
         # Stealth escalation levels
         self.stealth_levels = {
@@ -65,23 +327,17 @@ class Crawl4AIStealthEngine:
             4: "Maximum stealth - human behavior patterns",
             5: "Extreme stealth - all features + custom JS"
         }
+        
+        # Merged per-level config kwargs, built once instead of on every crawl
+        self._level_configs: List[Dict[str, Any]] = [self._build_level_config(level) for level in range(1, 6)]
+        self._run_configs: List[CrawlerRunConfig] = [CrawlerRunConfig(**cfg) for cfg in self._level_configs]
+        
+        # One browser per event loop, shared across calls (see PooledCrawlerMixin)
+        super().__init__()
     
-    def _setup_logging(self) -> logging.Logger:
-        """Setup detailed logging"""
-        logger = logging.getLogger("crawl4ai_stealth")
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-        return logger
-
-    def create_stealth_config(self, level: int = 5, custom_user_agent: str = None) -> CrawlerRunConfig:
+    def _build_level_config(self, level: int) -> Dict[str, Any]:
         """
-        Create stealth configuration based on official 0.7.x approach with CDN bypass
+        Build the run-config kwargs for a stealth level (official 0.7.x approach with CDN bypass)
         """
         # Base stealth configuration using proven 0.7.x methods
         base_config = {
@@ -101,13 +357,6 @@ class Crawl4AIStealthEngine:
             "verbose": True
         }
         
-        # Custom user agent override or use random selection
-        if custom_user_agent:
-            base_config["user_agent"] = custom_user_agent
-        else:
-            # Use random user agent from our proven list
-            base_config["user_agent"] = random.choice(self.stealth_user_agents)
-        
         # Level-specific enhancements with enhanced timing
         if level >= 2:
             base_config.update({
@@ -139,7 +388,6 @@ class Crawl4AIStealthEngine:
                 "js_code": self._get_stealth_javascript(),
                 "mean_delay": 4.5,
                 "max_range": 9.0,
-                "delay_before_return_html": 8.0,
                 "session_id": "max_stealth_session",
                 "page_timeout": 40000,  # Reasonable timeout to prevent hangs
                 "wait_until": "domcontentloaded",  # More reliable than networkidle
@@ -147,297 +395,75 @@ class Crawl4AIStealthEngine:
                 "adjust_viewport_to_content": True  # Dynamic viewport adjustment
             })
         
-        return CrawlerRunConfig(**base_config)
+        return base_config
+    
+    def create_stealth_config(self, level: int = 5, custom_user_agent: str = None,
+                              wait_for_selector: str = None, shared_session: bool = True) -> CrawlerRunConfig:
+        """
+        Create stealth configuration based on official 0.7.x approach with CDN bypass
+        """
+        # Shallow-copy the prebuilt level config (levels outside 1-5 behave like the nearest
+        # defined level); clone() would re-run __init__ over every field
+        config = copy.copy(self._run_configs[min(max(level, 1), 5) - 1])
+        
+        # Custom user agent override or use random selection from our proven list
+        config.user_agent = custom_user_agent or random.choice(self.stealth_user_agents)
+        
+        # Return as soon as known content renders; the long fixed delay is only a fallback
+        if wait_for_selector:
+            config.wait_for = f"css:{wait_for_selector}"
+            config.delay_before_return_html = 1.0
+        
+        # Levels 4-5 pin a fixed session_id (one browser tab); concurrent crawls must not share it
+        if not shared_session:
+            config.session_id = None
+        
+        return config
     
     def _get_stealth_javascript(self) -> str:
         """
         Advanced JavaScript for maximum stealth behavior with CDN bypass techniques
         Simulates realistic human browsing patterns and evades fingerprinting
         """
-        return """
-        // Advanced stealth behavior simulation with CDN/edge bypass techniques
-        (async () => {
-            const wait = (ms) => new Promise(r => setTimeout(r, ms + Math.random() * ms * 0.4));
-            
-            // Advanced fingerprinting evasion
-            console.log('🥷 Advanced stealth mode activated - CDN bypass techniques');
-            
-            // 1. Override webdriver detection
-            if (navigator.webdriver) {
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-            }
-            
-            // 2. Simulate realistic viewport and screen properties
-            const viewport = {
-                width: window.innerWidth,
-                height: window.innerHeight
-            };
-            
-            // 3. Add realistic browser plugins simulation
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => ({
-                    length: 3,
-                    0: { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
-                    1: { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
-                    2: { name: 'Native Client', filename: 'internal-nacl-plugin' }
-                })
-            });
-            
-            // 4. Simulate realistic language preferences (Brazilian Portuguese)
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['pt-BR', 'pt', 'en-US', 'en']
-            });
-            
-            // 5. Wait for initial page load (CDN detection often checks immediate behavior)
-            await wait(3000);
-            
-            // 1. Natural mouse movement patterns
-            const mouseEvents = ['mousemove', 'mouseenter', 'mouseleave'];
-            for (let i = 0; i < 8; i++) {
-                const x = Math.random() * viewport.width * 0.9 + viewport.width * 0.05;
-                const y = Math.random() * viewport.height * 0.9 + viewport.height * 0.05;
-                
-                // Create realistic mouse movement
-                const event = new MouseEvent('mousemove', {
-                    clientX: x,
-                    clientY: y,
-                    bubbles: true,
-                    cancelable: true,
-                    view: window
-                });
-                document.dispatchEvent(event);
-                await wait(180);
-            }
-            
-            // 2. Human reading pattern scrolling
-            const totalHeight = Math.max(
-                document.body.scrollHeight,
-                document.documentElement.scrollHeight,
-                document.body.offsetHeight,
-                document.documentElement.offsetHeight,
-                document.body.clientHeight,
-                document.documentElement.clientHeight
-            );
-            
-            const scrollSteps = Math.min(Math.floor(totalHeight / viewport.height), 8);
-            console.log(`📜 Simulating ${scrollSteps} scroll steps for reading pattern`);
-            
-            for (let i = 0; i < scrollSteps; i++) {
-                const progress = i / Math.max(scrollSteps - 1, 1);
-                const targetY = totalHeight * progress * 0.85; // Don't scroll to absolute bottom
-                
-                window.scrollTo({
-                    top: targetY,
-                    behavior: 'smooth'
-                });
-                
-                await wait(1400);
-                
-                // Occasional micro-adjustments (human behavior)
-                if (Math.random() > 0.65) {
-                    const microAdjust = (Math.random() - 0.5) * 100;
-                    window.scrollBy(0, microAdjust);
-                    await wait(350);
-                }
-                
-                // Random pause simulation (reading comprehension)
-                if (Math.random() > 0.75) {
-                    await wait(2500);
-                }
-                
-                // Interact with page elements occasionally
-                if (Math.random() > 0.8) {
-                    const clickableElements = document.querySelectorAll('button, a, input, [role="button"]');
-                    if (clickableElements.length > 0) {
-                        const randomElement = clickableElements[Math.floor(Math.random() * Math.min(clickableElements.length, 3))];
-                        if (randomElement && randomElement.offsetHeight > 0) {
-                            // Simulate hover without clicking
-                            const hoverEvent = new MouseEvent('mouseenter', {
-                                bubbles: true,
-                                cancelable: true,
-                                view: window
-                            });
-                            randomElement.dispatchEvent(hoverEvent);
-                            await wait(200);
-                        }
-                    }
-                }
-            }
-            
-            // 3. Return to optimal reading position
-            const readingPosition = Math.min(viewport.height * 0.3, totalHeight * 0.1);
-            window.scrollTo({
-                top: readingPosition,
-                behavior: 'smooth'
-            });
-            await wait(800);
-            
-            // 4. Close any overlays or popups that might interfere
-            const overlaySelectors = [
-                '.popup', '.modal', '.overlay', '.cookie-banner', 
-                '.newsletter-popup', '[data-testid*="popup"]',
-                '[class*="modal"]', '[class*="overlay"]'
-            ];
-            
-            overlaySelectors.forEach(selector => {
-                const overlays = document.querySelectorAll(selector);
-                overlays.forEach(overlay => {
-                    const closeBtn = overlay.querySelector('.close, .dismiss, [aria-label*="close" i], .fa-times, .x-button, [data-testid*="close"]');
-                    if (closeBtn) {
-                        console.log('🚫 Closing overlay/popup');
-                        closeBtn.click();
-                    } else if (overlay.style) {
-                        overlay.style.display = 'none';
-                    }
-                });
-            });
-            
-            // 5. Advanced CDN bypass techniques
-            
-            // A) Header consistency simulation (CDN often checks request headers vs JS environment)
-            if (navigator.language !== 'pt-BR') {
-                Object.defineProperty(navigator, 'language', {
-                    get: () => 'pt-BR',
-                    configurable: false
-                });
-            }
-            
-            // B) Request interception simulation
-            if (window.fetch) {
-                const originalFetch = window.fetch;
-                window.fetch = function(...args) {
-                    console.log('🌐 Intercepted fetch request:', args[0]);
-                    return originalFetch.apply(this, args);
-                };
-            }
-            
-            // C) Simulate genuine browser timing patterns
-            window.performance.mark('page-interaction-start');
-            
-            // D) Override common bot detection methods
-            Object.defineProperty(window, 'outerHeight', {
-                get: () => window.innerHeight
-            });
-            Object.defineProperty(window, 'outerWidth', {
-                get: () => window.innerWidth  
-            });
-            
-            // E) Simulate realistic timezone and language consistency
-            const timezone = Intl.DateTimeFormat().resolvedOptions().timeZone;
-            if (timezone !== 'America/Sao_Paulo') {
-                // Override timezone to match Brazilian target
-                Object.defineProperty(Intl.DateTimeFormat.prototype, 'resolvedOptions', {
-                    value: function() { 
-                        return { ...this.constructor.prototype.resolvedOptions.call(this), timeZone: 'America/Sao_Paulo' }; 
-                    }
-                });
-            }
-            
-            // F) Add realistic CPU usage patterns (prevents too-fast execution detection)
-            for (let i = 0; i < 50; i++) {
-                Math.random() * Math.random() * new Date().getTime();
-                if (i % 10 === 0) await wait(5);
-            }
-            
-            // G) Advanced fingerprint consistency
-            const originalGetContext = HTMLCanvasElement.prototype.getContext;
-            HTMLCanvasElement.prototype.getContext = function(contextType, ...args) {
-                if (contextType === '2d') {
-                    const context = originalGetContext.apply(this, arguments);
-                    // Add noise to prevent canvas fingerprinting
-                    if (context) {
-                        const originalGetImageData = context.getImageData;
-                        context.getImageData = function() {
-                            const imageData = originalGetImageData.apply(this, arguments);
-                            if (imageData && imageData.data) {
-                                // Add minimal noise to bypass fingerprinting
-                                for (let i = 0; i < imageData.data.length; i += 100) {
-                                    imageData.data[i] = imageData.data[i] ^ (Math.random() > 0.5 ? 1 : 0);
-                                }
-                            }
-                            return imageData;
-                        };
-                    }
-                    return context;
-                }
-                return originalGetContext.apply(this, arguments);
-            };
-            
-            // 6. Final human behavior - random focus events
-            const focusableElements = document.querySelectorAll('input, button, a, select, textarea');
-            if (focusableElements.length > 0) {
-                const randomFocusable = focusableElements[Math.floor(Math.random() * Math.min(focusableElements.length, 5))];
-                if (randomFocusable && randomFocusable.offsetHeight > 0) {
-                    randomFocusable.focus();
-                    await wait(300);
-                    randomFocusable.blur();
-                }
-            }
-            
-            console.log('✅ Advanced stealth simulation completed');
-        })();
-        """
+        return _STEALTH_JS_MIN
     
-    async def stealth_crawl(self, url: str, stealth_level: int = 5, custom_user_agent: str = None) -> StealthResult:
+    async def stealth_crawl(self, url: str, stealth_level: int = 5, custom_user_agent: str = None,
+                            wait_for_selector: str = None, shared_session: bool = True) -> StealthResult:
         """
         Execute stealth crawl with maximum anti-detection
         """
         start_time = time.time()
-        self.logger.info(f"🥷 Starting stealth crawl (level {stealth_level}): {url}")
+        self.logger.info("🥷 Starting stealth crawl (level %s): %s", stealth_level, url)
         
         try:
             # Create stealth configuration
-            config = self.create_stealth_config(stealth_level, custom_user_agent)
+            config = self.create_stealth_config(stealth_level, custom_user_agent, wait_for_selector, shared_session)
             
             # Set markdown generator
-            config.markdown_generator = DefaultMarkdownGenerator()
+            config.markdown_generator = _MARKDOWN_GEN
             
             # Get the user agent that will be used
             used_user_agent = custom_user_agent or "randomized"
             
-            self.logger.info(f"🔧 Stealth config: {self.stealth_levels.get(stealth_level, 'Unknown level')}")
-            self.logger.info(f"🎭 User agent: {'custom' if custom_user_agent else 'randomized'}")
-            
-            # Enhanced browser configuration for maximum stealth
-            from crawl4ai import BrowserConfig
-            browser_config = BrowserConfig(
-                headless=True,
-                browser_type="chromium", 
-                user_agent=config.user_agent,
-                viewport_width=1920,
-                viewport_height=1080,
-                accept_downloads=False,
-                java_script_enabled=True
-            )
+            self.logger.info("🔧 Stealth config: %s", self.stealth_levels.get(stealth_level, 'Unknown level'))
+            self.logger.info("🎭 User agent: %s", 'custom' if custom_user_agent else 'randomized')
             
-            # Execute crawl with enhanced stealth config
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                result = await crawler.arun(url, config=config)
+            # Execute crawl with enhanced stealth config on the shared browser
+            crawler = await self._get_crawler()
+            result = await crawler.arun(url, config=config)
             
             response_time = time.time() - start_time
             
             if result.success:
-                # Check if we bypassed detection (more specific indicators)
-                content = result.markdown.lower()
-                
-                # Primary detection indicators (definitive bot challenges)
-                primary_indicators = [
-                    'complete o captcha', 'i\'m not a robot', 'verify you are human',
-                    'bot detection', 'access denied', 'blocked', 'suspicious activity',
-                    'security check', 'verification required', 'parece que você acessou nosso site de uma forma'
-                ]
-                
                 # Check for actual challenge page vs legitimate content mentioning these words
-                is_challenge_page = any(indicator in content for indicator in primary_indicators)
-                has_product_content = any(term in content for term in ['produto', 'preço', 'comprar', 'adicionar'])
+                is_challenge_page = bool(_CHALLENGE_RE.search(result.markdown))
+                has_product_content = bool(_PRODUCT_RE.search(result.markdown))
                 
                 # Detection is bypassed if no challenge page indicators OR has actual product content
                 detection_bypassed = not is_challenge_page or has_product_content
                 
-                self.logger.info(f"✅ Crawl successful in {response_time:.2f}s")
-                self.logger.info(f"🛡️ Detection bypassed: {detection_bypassed}")
+                self.logger.info("✅ Crawl successful in %.2fs", response_time)
+                self.logger.info("🛡️ Detection bypassed: %s", detection_bypassed)
                 
                 return StealthResult(
                     success=True,
@@ -460,7 +486,7 @@ class Crawl4AIStealthEngine:
                     metadata=result.metadata
                 )
             else:
-                self.logger.error(f"❌ Crawl failed: {result.error_message}")
+                self.logger.error("❌ Crawl failed: %s", result.error_message)
                 return StealthResult(
                     success=False,
                     url=url,
@@ -474,7 +500,7 @@ class Crawl4AIStealthEngine:
                 
         except Exception as e:
             response_time = time.time() - start_time
-            self.logger.error(f"💥 Stealth crawl exception: {e}")
+            self.logger.error("💥 Stealth crawl exception: %s", e)
             return StealthResult(
                 success=False,
                 url=url,
@@ -486,35 +512,94 @@ class Crawl4AIStealthEngine:
                 error=str(e)
             )
     
+    async def stealth_crawl_many(self, urls: List[str], concurrency: int = _BULK_CONCURRENCY,
+                                 stealth_level: int = 3, wait_for_selector: str = None) -> List[StealthResult]:
+        """
+        Stealth-crawl many URLs concurrently on the shared browser, in input order.
+        Each URL gets its own tab: the fixed level 4-5 session_id is dropped in bulk mode.
+        """
+        sem = asyncio.BoundedSemaphore(concurrency)
+
+        async def crawl_one(url: str) -> StealthResult:
+            async with sem:
+                return await self.stealth_crawl(url, stealth_level, wait_for_selector=wait_for_selector,
+                                                shared_session=False)
+
+        return await asyncio.gather(*(crawl_one(url) for url in urls))
+    
     async def test_stealth_levels(self, url: str) -> Dict[int, StealthResult]:
         """
-        Test all stealth levels against a target URL
+        Test stealth levels against a target URL, stopping once the lowest bypassing level is known.
+        Levels above it that were still running are cancelled and left out of the results.
         """
-        self.logger.info(f"🧪 Testing all stealth levels against: {url}")
-        results = {}
-        
-        for level in range(1, 6):
-            self.logger.info(f"\n📊 Testing stealth level {level}: {self.stealth_levels[level]}")
-            result = await self.stealth_crawl(url, stealth_level=level)
-            results[level] = result
-            
-            # Wait between tests to avoid rate limiting
-            await asyncio.sleep(2)
+        self.logger.info("🧪 Testing all stealth levels against: %s", url)
+        sem = asyncio.BoundedSemaphore(_LEVEL_TEST_CONCURRENCY)
+
+        async def run_level(level: int) -> StealthResult:
+            async with sem:
+                # Jittered start instead of a fixed pause to avoid rate limiting
+                await asyncio.sleep(random.uniform(0, 2))
+                self.logger.info("\n📊 Testing stealth level %s: %s", level, self.stealth_levels[level])
+                return await self.stealth_crawl(url, stealth_level=level)
+
+        tasks = {asyncio.create_task(run_level(level)): level for level in range(1, 6)}
+        pending = set(tasks)
+        results: Dict[int, StealthResult] = {}
+        lowest_bypass = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    level = tasks[task]
+                    results[level] = task.result()
+                    if results[level].detection_bypassed and (lowest_bypass is None or level < lowest_bypass):
+                        lowest_bypass = level
+                # Every cheaper level has answered, so higher levels can't change the verdict
+                if lowest_bypass is not None and all(level in results for level in range(1, lowest_bypass)):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
-        return results
+        return dict(sorted(results.items()))
     
-    async def benchmark_stealth(self, benchmark_url: str = "https://www.magazineluiza.com.br/celulares-e-smartphones/l/te/") -> Dict[str, Any]:
+    async def benchmark_stealth(self, benchmark_url: str = "https://www.magazineluiza.com.br/celulares-e-smartphones/l/te/",
+                                wait_for_selector: str = None) -> Dict[str, Any]:
         """
         Benchmark stealth capabilities against the Magazine Luiza target
         """
-        self.logger.info(f"🎯 Benchmarking stealth against: {benchmark_url}")
+        self.logger.info("🎯 Benchmarking stealth against: %s", benchmark_url)
+        
+        if wait_for_selector is None and "magazineluiza.com.br" in benchmark_url:
+            wait_for_selector = _MAGALU_PRODUCT_SELECTOR
+        sem = asyncio.BoundedSemaphore(_LEVEL_TEST_CONCURRENCY)
         
-        # Test maximum stealth
-        result = await self.stealth_crawl(benchmark_url, stealth_level=5)
+        async def run_level(level: int) -> StealthResult:
+            async with sem:
+                await asyncio.sleep(random.uniform(0, 2))
+                return await self.stealth_crawl(benchmark_url, stealth_level=level, wait_for_selector=wait_for_selector)
+        
+        # Benchmark the upper levels concurrently; report the lowest one that bypassed detection
+        by_level = dict(zip(_BENCHMARK_LEVELS, await asyncio.gather(*(run_level(level) for level in _BENCHMARK_LEVELS))))
+        effective_level = next((level for level, r in by_level.items() if r.detection_bypassed), None)
+        level_used = effective_level or _BENCHMARK_LEVELS[-1]
+        result = by_level[level_used]
         
         benchmark_report = {
             "target_url": benchmark_url,
-            "stealth_level_used": 5,
+            "stealth_level_used": level_used,
+            "effective_level": effective_level,
+            "levels": {
+                level: {
+                    "success": r.success,
+                    "detection_bypassed": r.detection_bypassed,
+                    "response_time": r.response_time,
+                    "content_size": len(r.content),
+                    "error": r.error
+                }
+                for level, r in by_level.items()
+            },
             "success": result.success,
             "detection_bypassed": result.detection_bypassed,
             "response_time": result.response_time,
@@ -527,16 +612,15 @@ class Crawl4AIStealthEngine:
         
         # Analyze content for success indicators
         if result.success and result.content:
-            content_lower = result.content.lower()
             success_indicators = {
-                "has_products": any(word in content_lower for word in ['celular', 'smartphone', 'produto', 'preco', 'price']),
-                "no_captcha": 'captcha' not in content_lower,
-                "no_block_message": 'bloqueado' not in content_lower and 'blocked' not in content_lower,
+                "has_products": bool(_SUCCESS_RE.search(result.content)),
+                "no_captcha": not _CAPTCHA_RE.search(result.content),
+                "no_block_message": not _BLOCK_RE.search(result.content),
                 "content_length": len(result.content)
             }
             benchmark_report["success_indicators"] = success_indicators
         
-        self.logger.info(f"📈 Benchmark completed: {'SUCCESS' if result.detection_bypassed else 'DETECTED'}")
+        self.logger.info("📈 Benchmark completed: %s", 'SUCCESS' if result.detection_bypassed else 'DETECTED')
         return benchmark_report
 
 # Export the main class
@@ -548,35 +632,57 @@ async def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Crawl4AI Definitive Stealth Engine")
-    parser.add_argument("url", help="URL to crawl")
+    parser.add_argument("url", nargs="?", help="URL to crawl")
+    parser.add_argument("--urls-file", dest="urls_file",
+                       help="Crawl every URL in this file (one per line) concurrently")
+    parser.add_argument("--concurrency", type=int, default=_BULK_CONCURRENCY,
+                       help="Concurrent tabs for --urls-file")
     parser.add_argument("--level", type=int, default=5, choices=[1,2,3,4,5], 
                        help="Stealth level (1-5)")
     parser.add_argument("--benchmark", action="store_true", 
                        help="Run benchmark against Magazine Luiza")
     parser.add_argument("--test-all-levels", action="store_true",
                        help="Test all stealth levels")
+    parser.add_argument("--wait-for", dest="wait_for",
+                       help="CSS selector to wait for instead of the fixed render delay")
     parser.add_argument("--output", help="Save results to JSON file")
     
     args = parser.parse_args()
+    if not args.url and not args.urls_file:
+        parser.error("a URL or --urls-file is required")
     
-    engine = Crawl4AIStealthEngine()
+    async with Crawl4AIStealthEngine() as engine:
+        if args.benchmark:
+            result = await engine.benchmark_stealth(args.url, wait_for_selector=args.wait_for)
+        elif args.test_all_levels:
+            results = await engine.test_stealth_levels(args.url)
+        elif args.urls_file:
+            urls = [line.strip() for line in Path(args.urls_file).read_text().splitlines()
+                    if line.strip() and not line.startswith("#")]
+            results = await engine.stealth_crawl_many(urls, args.concurrency, args.level, args.wait_for)
+        else:
+            result = await engine.stealth_crawl(args.url, stealth_level=args.level, wait_for_selector=args.wait_for)
     
     if args.benchmark:
-        result = await engine.benchmark_stealth(args.url)
         print("\n🎯 STEALTH BENCHMARK RESULTS")
         print("=" * 50)
-        print(json.dumps(result, indent=2))
+        print(dump_json_bytes(result).decode('utf-8'))
         
     elif args.test_all_levels:
-        results = await engine.test_stealth_levels(args.url)
         print("\n🧪 STEALTH LEVEL COMPARISON")
         print("=" * 50)
         for level, result in results.items():
             status = "✅ SUCCESS" if result.detection_bypassed else "❌ DETECTED"
             print(f"Level {level}: {status} ({result.response_time:.2f}s)")
         
+    elif args.urls_file:
+        print("\n📦 BULK STEALTH CRAWL RESULTS")
+        print("=" * 50)
+        for result in results:
+            status = "✅ SUCCESS" if result.detection_bypassed else "❌ DETECTED"
+            print(f"{status} ({result.response_time:.2f}s) {result.url}")
+        
     else:
-        result = await engine.stealth_crawl(args.url, stealth_level=args.level)
         print("\n🥷 STEALTH CRAWL RESULTS")
         print("=" * 50)
         print(f"Success: {result.success}")
@@ -587,11 +693,13 @@ async def main():
             print(f"Error: {result.error}")
     
     if args.output:
-        with open(args.output, 'w') as f:
-            if args.test_all_levels:
-                json.dump({k: result.__dict__ for k, result in results.items()}, f, indent=2)
-            else:
-                json.dump(result.__dict__ if not args.benchmark else result, f, indent=2)
+        if args.test_all_levels:
+            payload = {level: asdict(result) for level, result in results.items()}
+        elif args.urls_file:
+            payload = [asdict(result) for result in results]
+        else:
+            payload = result if args.benchmark else asdict(result)
+        Path(args.output).write_bytes(dump_json_bytes(payload))
         print(f"💾 Results saved to {args.output}")
 
 if __name__ == "__main__":
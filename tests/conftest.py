@@ -0,0 +1,11 @@
+"""Smoke-test setup: the crawler modules live flat at the repo root"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Every module under test imports crawl4ai at load time
+pytest.importorskip("crawl4ai")
@@ -0,0 +1,51 @@
+"""Smoke tests for the shared helpers in crawl4ai_common"""
+
+import asyncio
+import json
+import logging
+
+from crawl4ai_common import BoundedDict, close_pooled_resources, dump_json_bytes, minify_js
+
+
+def test_bounded_dict_evicts_least_recently_used():
+    cache = BoundedDict(maxlen=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b", "missing") == "missing"
+
+
+def test_minify_js_strips_comments_and_whitespace():
+    source = """
+    // leading comment
+    const url = 'https://example.com';  // trailing comment
+    run(url);
+    """
+    assert minify_js(source) == "const url = 'https://example.com'; run(url);"
+
+
+def test_dump_json_bytes_round_trips_unicode():
+    data = {"title": "Preço", "n": 1}
+    assert json.loads(dump_json_bytes(data)) == data
+
+
+def test_close_pooled_resources_logs_and_continues(caplog):
+    closed = []
+
+    class Broken:
+        async def aclose(self):
+            raise RuntimeError("close failed")
+
+    class Healthy:
+        async def aclose(self):
+            closed.append(self)
+
+    healthy = Healthy()
+    with caplog.at_level(logging.WARNING, logger="crawl4ai_common"):
+        asyncio.run(close_pooled_resources(Broken(), healthy))
+
+    assert closed == [healthy]
+    assert "close failed" in caplog.text
@@ -0,0 +1,82 @@
+"""Smoke tests for the enterprise crawler's batch, metrics and intent paths (no network)"""
+
+import asyncio
+import json
+
+import pytest
+
+from crawl4ai_enterprise import CrawlRequest, CrawlResult, EnterpriseWebCrawler, IntentType
+
+
+@pytest.fixture
+def crawler():
+    return EnterpriseWebCrawler()
+
+
+def test_batch_smart_crawl_list_keeps_request_order(crawler, monkeypatch):
+    urls = [f"https://example.com/{i}" for i in range(5)]
+
+    async def fake_smart_crawl(request):
+        index = urls.index(request.url)
+        # Later requests finish first, so completion order is the reverse of request order
+        await asyncio.sleep(0.01 * (len(urls) - index))
+        if index == 2:
+            raise RuntimeError("boom")
+        return CrawlResult(status="success", url=request.url)
+
+    monkeypatch.setattr(crawler, "smart_crawl", fake_smart_crawl)
+    results = asyncio.run(crawler.batch_smart_crawl_list([CrawlRequest(url=u) for u in urls], max_concurrent=5))
+
+    assert [r.url for r in results] == urls
+    assert [r.status for r in results] == ["success", "success", "error", "success", "success"]
+    assert results[2].error == "boom"
+
+
+def test_performance_metrics_are_json_serializable(crawler):
+    json.dumps(crawler.get_performance_metrics())
+
+    crawler._record_crawl(CrawlResult(status="success", url="https://example.com", performance={"duration": 1.0}))
+    crawler._record_crawl(CrawlResult(status="error", url="https://example.com/x", performance={"duration": 3.0}))
+    metrics = json.loads(json.dumps(crawler.get_performance_metrics()))
+
+    assert metrics["total_crawls"] == 2
+    assert metrics["avg_duration"] == pytest.approx(2.0)
+    assert metrics["success_rate"] == pytest.approx(0.5)
+    assert isinstance(metrics["features_available"], dict)
+
+
+def test_performance_metrics_returns_fresh_dicts(crawler):
+    crawler._record_crawl(CrawlResult(status="success", url="https://example.com", performance={"duration": 1.0}))
+    first = crawler.get_performance_metrics()
+    first["features_available"]["enterprise"] = "mutated"
+    first["total_crawls"] = -1
+
+    second = crawler.get_performance_metrics()
+    assert second["total_crawls"] == 1
+    assert second["features_available"]["enterprise"] != "mutated"
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://medium.com/@someone/a-post", IntentType.ARTICLE),
+    ("https://blog.medium.com/a-post", IntentType.ARTICLE),
+    ("medium.com/a-post", IntentType.ARTICLE),
+    ("www.amazon.com/dp/B000", IntentType.ECOMMERCE),
+    ("https://project.readthedocs.io/en/latest/", IntentType.DOCS),
+    ("https://example.com/2024/05/launch", IntentType.ARTICLE),
+    ("https://example.com/product/42", IntentType.ECOMMERCE),
+    ("https://example.com/dataset/prices", IntentType.DATA),
+    ("https://notmedium.com/about", IntentType.GENERIC),
+    ("https://example.com/", IntentType.GENERIC),
+])
+def test_detect_intent_from_url(crawler, url, expected):
+    assert crawler.detect_intent(url) == expected
+
+
+def test_detect_intent_falls_back_to_context(crawler):
+    assert crawler.detect_intent("https://example.com/", context="Latest news story") == IntentType.ARTICLE
+    assert crawler.detect_intent("https://example.com/", context="buy this") == IntentType.ECOMMERCE
+
+
+def test_discover_urls_rejects_non_positive_max_urls(crawler):
+    with pytest.raises(ValueError):
+        asyncio.run(crawler.discover_urls("https://example.com", "docs", max_urls=0))
@@ -0,0 +1,61 @@
+"""Smoke tests for the POC tool's result writer and keyword matching (no network)"""
+
+import json
+
+import pytest
+
+from crawl4ai_poc import Crawl4AIPOCTool, _keyword_pattern
+
+RESULTS = {
+    "url": "https://example.com",
+    "status": "success",
+    "individual_pages": [
+        {"url": "https://example.com/a", "title": "Página A"},
+        {"url": "https://example.com/b", "title": "Page B"},
+    ],
+}
+
+
+@pytest.fixture
+def tool():
+    return Crawl4AIPOCTool()
+
+
+def test_write_results_json(tool, tmp_path):
+    path = tool._write_results(RESULTS, tmp_path / "out.json")
+
+    assert json.loads(path.read_text(encoding="utf-8")) == RESULTS
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_results_ndjson_summary_then_records(tool, tmp_path):
+    path = tool._write_results(RESULTS, tmp_path / "out.ndjson")
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert lines[0] == {"url": "https://example.com", "status": "success"}
+    assert lines[1:] == RESULTS["individual_pages"]
+
+
+def test_write_results_text_content(tool, tmp_path):
+    path = tool._write_results({"content": "# Title\n"}, tmp_path / "out.md")
+
+    assert path.read_text(encoding="utf-8") == "# Title\n"
+
+
+def test_write_results_failure_keeps_previous_file(tool, tmp_path):
+    path = tmp_path / "out.json"
+    path.write_text("previous", encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        tool._write_results({"bad": object()}, path)
+
+    assert path.read_text(encoding="utf-8") == "previous"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_keyword_pattern_word_start():
+    pattern = _keyword_pattern(["install"], word_start=True)
+
+    assert pattern.search("Installed in seconds")
+    assert not pattern.search("reinstall the package")
+    assert _keyword_pattern([]) is None